@@ -12,7 +12,7 @@ from alembic import context
 
 from app.core.database import BaseModel
 from app.users.models import User
-from app.attendance.models import Attendance, AttendanceAudit
+from app.attendance.models import Attendance, AttendanceAudit, AttendanceMonthlyRollup
 from app.attendance_request.models import AttendanceRequest
 from app.holidays.models import PaidHoliday
 
@@ -0,0 +1,58 @@
+"""add attendance_monthly_rollup
+
+Revision ID: 3c1f8a2d9b47
+Revises: 76ad5cda7f17
+Create Date: 2026-01-12 10:04:21.418552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f8a2d9b47'
+down_revision: Union[str, Sequence[str], None] = '76ad5cda7f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('attendance_monthly_rollup',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('total_minutes', sa.Integer(), nullable=False),
+    sa.Column('overtime_minutes', sa.Integer(), nullable=False),
+    sa.Column('present_days', sa.Integer(), nullable=False),
+    sa.Column('missing_clock_outs', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.UniqueConstraint('user_id', 'month', name='uq_attendance_monthly_rollup_user_month')
+    )
+    op.create_index(op.f('ix_attendance_monthly_rollup_month'), 'attendance_monthly_rollup', ['month'], unique=False)
+
+    # backfill from existing attendance rows
+    op.execute(
+        """
+        INSERT INTO attendance_monthly_rollup
+            (user_id, month, total_minutes, overtime_minutes, present_days, missing_clock_outs)
+        SELECT
+            user_id,
+            date_trunc('month', attendance_date)::date,
+            COALESCE(SUM(total_minutes), 0),
+            COALESCE(SUM(overtime_minutes), 0),
+            COUNT(DISTINCT attendance_date),
+            COUNT(*) FILTER (WHERE clock_out IS NULL)
+        FROM attendance
+        GROUP BY user_id, date_trunc('month', attendance_date)::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_attendance_monthly_rollup_month'), table_name='attendance_monthly_rollup')
+    op.drop_table('attendance_monthly_rollup')
@@ -0,0 +1,34 @@
+"""pending attendance requests index
+
+Revision ID: 5b7e9f3c2a10
+Revises: 8e52d0c4a1f6
+Create Date: 2026-01-26 11:08:53.604917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e9f3c2a10'
+down_revision: Union[str, Sequence[str], None] = '8e52d0c4a1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_attendance_requests_pending',
+        'attendance_requests',
+        ['created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_attendance_requests_pending', table_name='attendance_requests')
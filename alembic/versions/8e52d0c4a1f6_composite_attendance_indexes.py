@@ -0,0 +1,157 @@
+"""composite attendance indexes
+
+Revision ID: 8e52d0c4a1f6
+Revises: 3c1f8a2d9b47
+Create Date: 2026-01-19 15:42:08.211374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e52d0c4a1f6'
+down_revision: Union[str, Sequence[str], None] = '3c1f8a2d9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Double punches created duplicate rows for the same user and day.
+    # Merge each group into its lowest id (earliest clock-in, latest
+    # clock-out) so the unique index can be built without losing hours.
+    op.execute(
+        """
+        CREATE TEMP TABLE attendance_duplicates AS
+        SELECT a.id, k.keep_id, a.user_id, a.attendance_date
+        FROM attendance a
+        JOIN (
+            SELECT user_id, attendance_date, min(id) AS keep_id
+            FROM attendance
+            GROUP BY user_id, attendance_date
+            HAVING count(*) > 1
+        ) k USING (user_id, attendance_date)
+        WHERE a.id <> k.keep_id
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE attendance s
+        SET clock_in = m.clock_in,
+            clock_out = m.clock_out,
+            total_minutes = m.worked,
+            overtime_minutes = GREATEST(m.worked - 510, 0),
+            is_manual = m.is_manual
+        FROM (
+            SELECT
+                g.keep_id,
+                g.clock_in,
+                g.clock_out,
+                g.is_manual,
+                CASE WHEN g.clock_out IS NULL THEN NULL
+                     ELSE GREATEST(
+                         floor(extract(epoch FROM g.clock_out - g.clock_in) / 60)::int,
+                         0
+                     )
+                END AS worked
+            FROM (
+                SELECT
+                    grp.keep_id,
+                    min(a.clock_in) AS clock_in,
+                    max(a.clock_out) AS clock_out,
+                    bool_or(a.is_manual) AS is_manual
+                FROM attendance a
+                JOIN (
+                    SELECT id, keep_id FROM attendance_duplicates
+                    UNION
+                    SELECT keep_id, keep_id FROM attendance_duplicates
+                ) grp ON grp.id = a.id
+                GROUP BY grp.keep_id
+            ) g
+        ) m
+        WHERE s.id = m.keep_id
+        """
+    )
+
+    # Keep audit history and requests attached to the surviving row
+    op.execute(
+        """
+        UPDATE attendance_audit t
+        SET attendance_id = d.keep_id
+        FROM attendance_duplicates d
+        WHERE t.attendance_id = d.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE attendance_requests t
+        SET attendance_id = d.keep_id
+        FROM attendance_duplicates d
+        WHERE t.attendance_id = d.id
+        """
+    )
+
+    op.execute(
+        """
+        DELETE FROM attendance a
+        USING attendance_duplicates d
+        WHERE a.id = d.id
+        """
+    )
+
+    # The 3c1f8a2d9b47 backfill counted the duplicates, recompute the
+    # affected (user, month) rollups from the merged rows
+    op.execute(
+        """
+        CREATE TEMP TABLE attendance_duplicate_months AS
+        SELECT DISTINCT user_id, date_trunc('month', attendance_date)::date AS month
+        FROM attendance_duplicates
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM attendance_monthly_rollup r
+        USING attendance_duplicate_months p
+        WHERE r.user_id = p.user_id
+          AND r.month = p.month
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO attendance_monthly_rollup
+            (user_id, month, total_minutes, overtime_minutes, present_days, missing_clock_outs)
+        SELECT
+            a.user_id,
+            date_trunc('month', a.attendance_date)::date,
+            COALESCE(SUM(a.total_minutes), 0),
+            COALESCE(SUM(a.overtime_minutes), 0),
+            COUNT(DISTINCT a.attendance_date),
+            COUNT(*) FILTER (WHERE a.clock_out IS NULL)
+        FROM attendance a
+        JOIN attendance_duplicate_months p
+          ON p.user_id = a.user_id
+         AND p.month = date_trunc('month', a.attendance_date)::date
+        GROUP BY a.user_id, date_trunc('month', a.attendance_date)::date
+        """
+    )
+
+    op.execute("DROP TABLE attendance_duplicate_months")
+    op.execute("DROP TABLE attendance_duplicates")
+
+    op.create_index('ux_attendance_user_id_attendance_date', 'attendance', ['user_id', 'attendance_date'], unique=True)
+    op.create_index('ix_attendance_attendance_date_user_id', 'attendance', ['attendance_date', 'user_id'], unique=False)
+
+    # Covered by the composite indexes above
+    op.drop_index('ix_attendance_user_id', table_name='attendance', if_exists=True)
+    op.drop_index('ix_attendance_attendance_date', table_name='attendance', if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_attendance_attendance_date', 'attendance', ['attendance_date'], unique=False)
+    op.create_index('ix_attendance_user_id', 'attendance', ['user_id'], unique=False)
+    op.drop_index('ix_attendance_attendance_date_user_id', table_name='attendance')
+    op.drop_index('ux_attendance_user_id_attendance_date', table_name='attendance')
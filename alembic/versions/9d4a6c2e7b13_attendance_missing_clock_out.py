@@ -0,0 +1,55 @@
+"""attendance missing_clock_out flag
+
+Revision ID: 9d4a6c2e7b13
+Revises: 5b7e9f3c2a10
+Create Date: 2026-02-02 10:21:37.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a6c2e7b13'
+down_revision: Union[str, Sequence[str], None] = '5b7e9f3c2a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'attendance',
+        sa.Column(
+            'missing_clock_out',
+            sa.Boolean(),
+            server_default=sa.false(),
+            nullable=False,
+        )
+    )
+
+    # Everything the nightly auto-close would have flagged so far
+    op.execute(
+        """
+        UPDATE attendance
+        SET missing_clock_out = true
+        WHERE clock_out IS NULL
+          AND attendance_date < (now() AT TIME ZONE 'Asia/Kolkata')::date
+        """
+    )
+
+    op.create_index(
+        'ix_attendance_open',
+        'attendance',
+        ['attendance_date', 'id'],
+        unique=False,
+        postgresql_where=sa.text("clock_out IS NULL AND NOT missing_clock_out"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_attendance_open', table_name='attendance')
+    op.drop_column('attendance', 'missing_clock_out')
@@ -0,0 +1,211 @@
+import asyncio
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from app.admin.repository import AdminRepository, LATE_AFTER
+from app.admin.schemas import (
+    AdminDashboardResponse,
+    TodayAttendanceDashboardItem,
+    PendingRequestDashboardItem
+)
+from app.attendance.models import Attendance
+from app.core.config import settings
+from app.core.database import DbSession
+from app.core.responses import dumps
+
+DASHBOARD_PENDING_LIMIT = 5
+IST = ZoneInfo("Asia/Kolkata")
+
+
+def attendance_status(clock_in: datetime | None) -> str:
+    """Python twin of the CASE in AdminRepository.get_dashboard_rows."""
+    if not clock_in:
+        return "Not In Yet"
+
+    return "Late" if clock_in.astimezone(IST).time() > LATE_AFTER else "Present"
+
+
+async def load_dashboard(repo: AdminRepository) -> AdminDashboardResponse:
+    rows = await repo.get_dashboard_rows(date.today(), DASHBOARD_PENDING_LIMIT)
+
+    today_attendance = []
+    pending_requests = []
+    pending_count = 0
+
+    for row in rows:
+        if row.kind == "attendance":
+            today_attendance.append(
+                TodayAttendanceDashboardItem(
+                    attendance_id=row.id,
+                    user_id=row.user_id,
+                    user_name=row.user_name,
+                    clock_in=row.at,
+                    clock_out=row.clock_out,
+                    status=row.status
+                )
+            )
+        else:
+            pending_requests.append(
+                PendingRequestDashboardItem(
+                    id=row.id,
+                    user_id=row.user_id,
+                    user_name=row.user_name,
+                    request_type=row.request_type,
+                    requested_time=row.at,
+                    status=row.status
+                )
+            )
+            pending_count = row.pending_count
+
+    return AdminDashboardResponse(
+        today_attendance=today_attendance,
+        pending_requests=pending_requests,
+        pending_count=pending_count
+    )
+
+
+def _event(name: str, payload) -> str:
+    data = dumps(payload).decode()
+    return f"event: {name}\ndata: {data}\n\n"
+
+
+class _Subscriber:
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+        # Set when events were dropped; the stream resyncs with a snapshot
+        self.lagged = False
+
+
+class DashboardBroadcaster:
+    """
+    Today's dashboard kept in memory while admins are connected.
+
+    Attendance changes are applied to the board and pushed as
+    "attendance" deltas. Request changes reload the pending head from the
+    database (they are rare and the head depends on the whole queue) and
+    push a "pending" event. Every stream starts with a "snapshot".
+
+    State is per process: with several workers, each one serves the
+    events published by its own requests.
+    """
+
+    def __init__(self, queue_size: int, keepalive: float):
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self.board: AdminDashboardResponse | None = None
+        self.board_date: date | None = None
+        self._subscribers: set[_Subscriber] = set()
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def stream(self):
+        subscriber = _Subscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+
+        # Nothing kept the board current while nobody was connected
+        if len(self._subscribers) == 1:
+            self.board = None
+
+        try:
+            yield _event("snapshot", await self._snapshot())
+
+            while True:
+                if subscriber.lagged:
+                    subscriber.lagged = False
+                    while not subscriber.queue.empty():
+                        subscriber.queue.get_nowait()
+                    yield _event("snapshot", await self._snapshot())
+                    continue
+
+                try:
+                    yield await asyncio.wait_for(
+                        subscriber.queue.get(), timeout=self.keepalive
+                    )
+                except asyncio.TimeoutError:
+                    # New day: everyone is back to "Not In Yet"
+                    if self.board_date and self.board_date != date.today():
+                        await self._reload("snapshot")
+                    yield ": keepalive\n\n"
+        finally:
+            self._subscribers.discard(subscriber)
+
+            if not self._subscribers:
+                self.board = None
+                self.board_date = None
+
+    async def attendance_changed(self, attendance: Attendance) -> None:
+        if not self.board or attendance.attendance_date != self.board_date:
+            return
+
+        for index, item in enumerate(self.board.today_attendance):
+            if item.user_id == attendance.user_id:
+                break
+        else:
+            # Not on the board yet (new user), rebuild it
+            self._spawn(self._reload("snapshot"))
+            return
+
+        item = item.model_copy(update={
+            "attendance_id": attendance.id,
+            "clock_in": attendance.clock_in,
+            "clock_out": attendance.clock_out,
+            "status": attendance_status(attendance.clock_in),
+        })
+        self.board.today_attendance[index] = item
+        self._publish(_event("attendance", item))
+
+    async def requests_changed(self) -> None:
+        if self.board:
+            self._spawn(self._reload("pending"))
+
+    async def board_changed(self) -> None:
+        if self.board:
+            self._spawn(self._reload("snapshot"))
+
+    async def _snapshot(self) -> AdminDashboardResponse:
+        if not self.board or self.board_date != date.today():
+            await self._reload(None)
+
+        return self.board
+
+    async def _reload(self, event: str | None) -> None:
+        async with self._lock:
+            async with DbSession() as session:
+                board = await load_dashboard(AdminRepository(session))
+
+            if self._subscribers:
+                self.board = board
+                self.board_date = date.today()
+
+        if event == "snapshot":
+            self._publish(_event("snapshot", board))
+        elif event == "pending":
+            self._publish(_event("pending", {
+                "pending_requests": board.pending_requests,
+                "pending_count": board.pending_count,
+            }))
+
+    def _publish(self, message: str) -> None:
+        for subscriber in self._subscribers:
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                subscriber.lagged = True
+
+    def _spawn(self, coro) -> None:
+        # Keep publishers off the database round trip
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "board_loaded": self.board is not None,
+        }
+
+
+dashboard_live = DashboardBroadcaster(
+    queue_size=settings.DASHBOARD_STREAM_QUEUE_SIZE,
+    keepalive=settings.DASHBOARD_STREAM_KEEPALIVE_SECONDS,
+)
@@ -1,9 +1,15 @@
-from sqlalchemy import select
+from datetime import date, time
+
+from sqlalchemy import select, func, case, cast, literal, literal_column, null, union_all, DateTime, String, Time
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.attendance.models import Attendance
+from app.attendance_request.models import AttendanceRequest
 from app.users.models import User
 from app.core.enums import UserRole
 
+LATE_AFTER = time(9, 0)
+
 
 class AdminRepository:
     def __init__(self, session: AsyncSession):
@@ -17,4 +23,75 @@ class AdminRepository:
         ).where(User.role == UserRole.USER)
 
         res = await self.session.execute(stmt)
-        return res.all()
\ No newline at end of file
+        return res.all()
+
+    async def get_dashboard_rows(self, today: date, pending_limit: int):
+        """
+        Today's board and the head of the pending queue as one result set.
+
+        Rows with kind "attendance" come first, one per user ordered by
+        name, with the Present/Late/Not In Yet status computed here.
+        Rows with kind "request" follow, oldest first, each carrying the
+        total pending count.
+        """
+        local_clock_in = cast(
+            func.timezone("Asia/Kolkata", Attendance.clock_in), Time
+        )
+
+        attendance = (
+            select(
+                literal("attendance").label("kind"),
+                Attendance.id.label("id"),
+                User.id.label("user_id"),
+                User.name.label("user_name"),
+                Attendance.clock_in.label("at"),
+                Attendance.clock_out.label("clock_out"),
+                case(
+                    (Attendance.clock_in.is_(None), "Not In Yet"),
+                    (local_clock_in > LATE_AFTER, "Late"),
+                    else_="Present",
+                ).label("status"),
+                null().cast(String).label("request_type"),
+                literal(0).label("pending_count"),
+                func.row_number().over(order_by=(User.name, User.id)).label("position"),
+            )
+            .select_from(User)
+            .outerjoin(
+                Attendance,
+                (Attendance.user_id == User.id)
+                & (Attendance.attendance_date == today),
+            )
+            .where(User.role == UserRole.USER)
+        )
+
+        # Inner select so the LIMIT applies to requests only and the
+        # window count sees the whole queue
+        pending = (
+            select(
+                literal("request").label("kind"),
+                AttendanceRequest.id.label("id"),
+                User.id.label("user_id"),
+                User.name.label("user_name"),
+                AttendanceRequest.requested_time.label("at"),
+                null().cast(DateTime(timezone=True)).label("clock_out"),
+                cast(AttendanceRequest.status, String).label("status"),
+                func.initcap(
+                    func.replace(cast(AttendanceRequest.request_type, String), "_", " ")
+                ).label("request_type"),
+                func.count().over().label("pending_count"),
+                func.row_number().over(
+                    order_by=(AttendanceRequest.created_at, AttendanceRequest.id)
+                ).label("position"),
+            )
+            .join(User, User.id == AttendanceRequest.user_id)
+            .where(AttendanceRequest.status == literal_column("'PENDING'"))
+            .order_by(AttendanceRequest.created_at, AttendanceRequest.id)
+            .limit(pending_limit)
+            .subquery()
+        )
+
+        rows = union_all(attendance, select(pending)).subquery()
+        stmt = select(rows).order_by(rows.c.kind, rows.c.position)
+
+        res = await self.session.execute(stmt)
+        return res.all()
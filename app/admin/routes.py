@@ -1,17 +1,31 @@
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 
 from app.core.dependencies import require_admin
 from app.auth.dependencies import get_current_user
+from app.auth.tokens import token_manager
+from app.core.database import pool_status
+from app.core.password import password_hasher
+from app.core.response_cache import response_cache
+from app.core.responses import FastJSONResponse
+from app.users.cache import user_cache
+from app.holidays.calendar import holiday_calendar
 from app.users.models import User
 from app.admin.service import AdminService
+from app.admin.dashboard import dashboard_live
+from app.attendance.auto_close import auto_close
 from app.admin.schemas import AdminTimeEditSchema
 from app.admin.schemas import AdminDashboardResponse
-from app.attendance.schemas import AttendanceResponseSchema
-from app.attendance_request.schemas import AttendanceRequestResponseSchema, AttendanceRequestAdminResponse
-from app.utils.date_utils import resolve_date_range
+from app.attendance.schemas import AttendanceResponseSchema, AttendanceImportResponse
+from app.attendance.cache import summary_key, months_key
+from app.attendance_request.schemas import AttendanceRequestResponseSchema
+from app.attendance_request.schemas import AttendanceRequestBulkReviewSchema, AttendanceRequestBulkReviewResponse
+from app.attendance_request.schemas import AttendanceRequestAdminPage
+from app.core.enums import ExportFormat, ImportFormat, AttendanceRequestType
+from app.utils.date_utils import resolve_date_range, is_closed_month
+from app.utils.export import export_response
 
 
 router = APIRouter(
@@ -30,6 +44,34 @@ async def admin_dashboard(
 ):
     return await service.get_dashboard()
 
+@router.get("/dashboard/stream")
+async def admin_dashboard_stream():
+    """
+    Server-sent events: a "snapshot" of the dashboard first, then
+    "attendance" and "pending" updates as they happen.
+    """
+    return StreamingResponse(
+        dashboard_live.stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+@router.get("/metrics")
+async def runtime_metrics():
+    return {
+        "db_pool": pool_status(),
+        "token_cache": token_manager.cache.stats(),
+        "user_cache": user_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "holiday_calendar": holiday_calendar.stats(),
+        "response_cache": response_cache.stats(),
+        "dashboard_stream": dashboard_live.stats(),
+        "auto_close": auto_close.stats(),
+    }
+
 @router.get("/attendance/monthly/{user_id}")
 async def attendance_by_month(
     user_id: int,
@@ -39,14 +81,30 @@ async def attendance_by_month(
     ),
     service: AdminService = Depends()
 ):
-    return await service.get_attendance_by_month(user_id, month)
+    return FastJSONResponse(
+        await service.get_attendance_by_month(user_id, month)
+    )
 
 @router.get(
     "/attendance-requests",
-    response_model=list[AttendanceRequestAdminResponse]
+    response_model=AttendanceRequestAdminPage
 )
-async def list_requests(service: AdminService = Depends()):
-    return await service.get_pending_requests()
+async def list_requests(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(
+        default=None,
+        description="next_cursor from the previous page"
+    ),
+    request_type: AttendanceRequestType | None = None,
+    user_id: int | None = None,
+    service: AdminService = Depends()
+):
+    return await service.get_pending_requests(
+        limit=limit,
+        cursor=cursor,
+        request_type=request_type,
+        user_id=user_id
+    )
 
 @router.put(
     "/attendance/{attendance_id}/time",
@@ -84,39 +142,89 @@ async def reject_request(
 ):
     return await service.reject_request(request_id, admin.id)
 
+@router.post(
+    "/attendance-requests/bulk",
+    response_model=AttendanceRequestBulkReviewResponse
+)
+async def review_requests(
+    payload: AttendanceRequestBulkReviewSchema,
+    admin: User = Depends(get_current_user),
+    service: AdminService = Depends()
+):
+    return await service.review_requests(
+        payload.request_ids,
+        approve=payload.action == "approve",
+        admin_id=admin.id
+    )
+
 
 @router.get("/attendance/summary")
 async def monthly_summary(
+    request: Request,
     month: str  = Query(
         description="Month in YYYY-MM format"
     ),
     service: AdminService = Depends()
 ):
-    return await service.get_monthly_summary(month)
+    key = summary_key(month) if is_closed_month(month) else None
+
+    return await response_cache.respond(
+        request,
+        key,
+        lambda: service.get_monthly_summary(month),
+    )
 
 @router.get("/attendance/months", response_model=list[str])
 async def get_attendance_months(
+    request: Request,
     service: AdminService = Depends()
 ):
-    return await service.get_available_months()
+    return await response_cache.respond(
+        request,
+        months_key(),
+        service.get_available_months,
+    )
 
 @router.get("/attendance/export/excel")
 async def export_attendance_excel(
     service: AdminService = Depends(),
     start_date: date | None = None,
     end_date: date | None = None,
+    fmt: ExportFormat = Query(
+        default=ExportFormat.XLSX,
+        alias="format",
+        description="xlsx, csv or parquet"
+    ),
 ):
     start_date, end_date = resolve_date_range(start_date, end_date)
 
-    excel_buffer = await service.export_attendance_excel(
+    content = await service.export_attendance(
         start_date=start_date,
         end_date=end_date,
+        fmt=fmt,
     )
 
-    return StreamingResponse(
-        excel_buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename=attendance_{start_date}_{end_date}.xlsx"
-        },
-    )
+    return export_response(content, fmt, start_date, end_date)
+
+@router.post(
+    "/attendance/import",
+    response_model=AttendanceImportResponse
+)
+async def import_attendance(
+    request: Request,
+    fmt: ImportFormat = Query(
+        default=ImportFormat.CSV,
+        alias="format",
+        description="csv or ndjson"
+    ),
+    service: AdminService = Depends()
+):
+    """
+    Load a door terminal punch log streamed as the request body.
+
+    CSV needs a header with user_id and timestamp columns, NDJSON one
+    object per line with the same keys. An optional direction column
+    (in/out) is used when the terminal logs it. Timestamps without an
+    offset are IST. Bad lines are reported per row, the rest is loaded.
+    """
+    return await service.import_attendance(request.stream(), fmt)
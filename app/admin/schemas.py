@@ -8,6 +8,7 @@ class TodayAttendanceDashboardItem(BaseModel):
     user_id: int
     user_name: str
     clock_in: Optional[datetime]
+    clock_out: Optional[datetime] = None
     status: str   # Present | Late | Not In Yet
 
 
@@ -23,6 +24,7 @@ class PendingRequestDashboardItem(BaseModel):
 class AdminDashboardResponse(BaseModel):
     today_attendance: List[TodayAttendanceDashboardItem]
     pending_requests: List[PendingRequestDashboardItem]
+    pending_count: int
 
 class AdminTimeEditSchema(BaseModel):
     clock_in: datetime | None = None
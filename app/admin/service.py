@@ -1,5 +1,3 @@
-from datetime import datetime, time
-from zoneinfo import ZoneInfo
 from decimal import Decimal, ROUND_HALF_UP
 
 from fastapi import Depends
@@ -8,18 +6,14 @@ from app.attendance.service import AttendanceService
 from app.attendance.dependencies import AttendanceServiceDep
 from app.attendance_request.service import AttendanceRequestService
 from app.attendance_request.dependencies import AttendanceRequestServiceDep
-from app.admin.schemas import (
-    AdminDashboardResponse,
-    TodayAttendanceDashboardItem,
-    PendingRequestDashboardItem
-)
+from app.admin.schemas import AdminDashboardResponse
+from app.admin.dashboard import load_dashboard
 from app.admin.repository import AdminRepository
 from app.admin.dependencies import get_repository
 from app.admin.schemas import AdminTimeEditSchema
-from app.utils.date_utils import get_month_range
+from app.core.enums import ExportFormat, ImportFormat, AttendanceRequestType
 
 MINUTES_PER_DAY = 8 * 60 + 30
-IST = ZoneInfo("Asia/Kolkata")
 
 
 class AdminService:
@@ -58,19 +52,36 @@ class AdminService:
             admin_id
         )
 
-    async def get_pending_requests(self):
-        return await self.request_service.get_pending_requests()
+    async def review_requests(self, request_ids: list[int], approve: bool, admin_id: int):
+        return await self.request_service.review_requests(
+            request_ids,
+            approve=approve,
+            admin_id=admin_id
+        )
+
+    async def get_pending_requests(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        request_type: AttendanceRequestType | None = None,
+        user_id: int | None = None,
+    ):
+        return await self.request_service.get_pending_requests(
+            limit=limit,
+            cursor=cursor,
+            request_type=request_type,
+            user_id=user_id
+        )
     
     async def get_monthly_summary(self, month: str):
         users = await self.admin_repo.get_users_with_attendance()
+        summaries = await self.attendance_service.get_monthly_summaries(month)
         results = []
 
         for user in users:
-            summary = await self.attendance_service.get_monthly_summary(
-                user.id, month
-            )
+            summary = summaries.get(user.id)
 
-            if summary["presentDays"] == 0:
+            if not summary or summary["presentDays"] == 0:
                 continue
 
             worked_days = (
@@ -85,14 +96,6 @@ class AdminService:
                 payable_days * user.perday_rate
             ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
-            # ---- Missing clock-out
-            year, month_num = map(int, month.split("-"))
-            start, end = get_month_range(year, month_num)
-
-            missing_clock_outs = await self.attendance_service.get_missing_clock_out_count(
-                user.id, start, end
-            )
-
             results.append({
                 "userId": user.id,
                 "userName": user.name,
@@ -103,60 +106,19 @@ class AdminService:
                 "totalWorkingMinutes": summary["totalWorkingMinutes"],
                 "overtimeMinutes": summary["overtimeMinutes"],
                 "payableAmount": payable_amount,
-                "missingClockOutCount": missing_clock_outs,
+                "missingClockOutCount": summary["missingClockOutCount"],
             })
 
         return results
     
     async def get_dashboard(self) -> AdminDashboardResponse:
-        today_attendance = await self.get_today_attendance_all_users()
-        pending_requests = await self.get_pending_requests()
-
-        dashboard_attendance = []
-
-        for item in today_attendance:
-            status = "Not In Yet"
-
-            if item.clock_in:
-                clock_in = item.clock_in.astimezone(IST)
-
-                late_cutoff = datetime.combine(
-                    clock_in.date(),
-                    time(9, 00),
-                    tzinfo=IST
-                )
-
-                status = "Late" if clock_in > late_cutoff else "Present"
-
-            dashboard_attendance.append(
-                TodayAttendanceDashboardItem(
-                    attendance_id=item.attendance_id,
-                    user_id=item.user_id,
-                    user_name=item.user_name,
-                    clock_in=item.clock_in,
-                    status=status
-                )
-            )
-
-        dashboard_requests = [
-            PendingRequestDashboardItem(
-                id=req.id,
-                user_id=req.user.id if req.user else req.user_id,
-                user_name=req.user.name if req.user else "Unknown",
-                request_type=req.request_type.label(),
-                requested_time=req.requested_time,
-                status=req.status
-            )
-            for req in pending_requests
-        ]
-
-        return AdminDashboardResponse(
-            today_attendance=dashboard_attendance,
-            pending_requests=dashboard_requests[:5]  # limit for dashboard
-        )
+        return await load_dashboard(self.admin_repo)
 
     async def get_available_months(self):
         return await self.attendance_service.get_available_months_all_users()
     
-    async def export_attendance_excel(self, start_date, end_date):
-        return await self.attendance_service.export_attendance_excel(start_date, end_date)
+    async def export_attendance(self, start_date, end_date, fmt: ExportFormat):
+        return await self.attendance_service.export_attendance(start_date, end_date, fmt)
+
+    async def import_attendance(self, chunks, fmt: ImportFormat):
+        return await self.attendance_service.import_punches(chunks, fmt)
@@ -0,0 +1,169 @@
+import asyncio
+import time as clock
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from app.admin.dashboard import dashboard_live
+from app.attendance.cache import invalidate_bulk
+from app.attendance.repository import AttendanceRepository
+from app.attendance.service import STANDARD_WORK_MINUTES
+from app.attendance_request.repository import AttendanceRequestRepository
+from app.core.config import settings
+from app.core.database import DbSession
+from app.core.enums import AttendanceRequestType, AttendanceRequestStatus
+
+IST = ZoneInfo("Asia/Kolkata")
+AUTO_CLOSE_REASON = "No clock-out recorded"
+# A failed sweep is retried after 1, 2, 4 ... minutes, at most hourly
+RETRY_MIN_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+
+
+class AutoCloseTask:
+    """
+    Nightly sweep of days that were never clocked out.
+
+    Runs once at startup, catching up on nights the app was down, then
+    every day at `run_at` IST, and sooner with backoff after a failure. Each batch is one transaction that walks
+    ix_attendance_open and sets missing_clock_out, so payroll reads the
+    flag instead of counting open rows. Policies:
+
+        flag     only flag the day
+        cap      also close it at clock-in + the standard shift
+        request  flag it and open a pending FORGOT_CLOCK_OUT request
+
+    Rows are locked with SKIP LOCKED, so every worker process can run
+    its own sweeper without closing a day twice.
+    """
+
+    def __init__(self, policy: str, run_at: time, batch_size: int):
+        self.policy = policy
+        self.run_at = run_at
+        self.batch_size = batch_size
+
+        self.last_run: float | None = None
+        self.last_closed = 0
+        self.total_closed = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._loop())
+
+    async def shutdown(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> int:
+        """Sweep every open day before today (IST), returns how many."""
+        today = datetime.now(IST).date()
+        closed = 0
+
+        while True:
+            async with DbSession() as session:
+                rows = await self._sweep_batch(session, today)
+
+            if rows:
+                closed += len(rows)
+                await invalidate_bulk(
+                    {row.user_id for row in rows},
+                    {row.attendance_date.strftime("%Y-%m") for row in rows},
+                )
+
+            if len(rows) < self.batch_size:
+                break
+
+        if closed and self.policy == "request":
+            await dashboard_live.requests_changed()
+
+        self.last_run = clock.time()
+        self.last_closed = closed
+        self.total_closed += closed
+        return closed
+
+    async def _sweep_batch(self, session, today: date):
+        attendance_repo = AttendanceRepository(session)
+
+        rows = await attendance_repo.close_open_days(
+            before=today,
+            limit=self.batch_size,
+            cap_minutes=STANDARD_WORK_MINUTES if self.policy == "cap" else None,
+        )
+
+        if not rows:
+            return rows
+
+        if self.policy == "request":
+            request_repo = AttendanceRequestRepository(session)
+
+            # The employee may already have asked for this day
+            pending = await request_repo.get_pending_attendance_ids(
+                [row.id for row in rows]
+            )
+            await request_repo.bulk_insert([
+                {
+                    "user_id": row.user_id,
+                    "attendance_id": row.id,
+                    "request_type": AttendanceRequestType.FORGOT_CLOCK_OUT,
+                    "requested_time": row.clock_in + timedelta(minutes=STANDARD_WORK_MINUTES),
+                    "reason": AUTO_CLOSE_REASON,
+                    "status": AttendanceRequestStatus.PENDING,
+                }
+                for row in rows
+                if row.id not in pending
+            ])
+
+        await attendance_repo.refresh_monthly_rollups(
+            {(row.user_id, row.attendance_date) for row in rows}
+        )
+        await attendance_repo.commit()
+
+        return rows
+
+    def _seconds_until_next_run(self) -> float:
+        now = datetime.now(IST)
+        next_run = datetime.combine(now.date(), self.run_at, tzinfo=IST)
+
+        if next_run <= now:
+            next_run += timedelta(days=1)
+
+        return (next_run - now).total_seconds()
+
+    async def _loop(self):
+        retry = RETRY_MIN_SECONDS
+
+        while True:
+            try:
+                await self.run_once()
+            except Exception as exc:
+                # The flag makes sweeps resumable, retry well before tomorrow
+                self.failures += 1
+                self.last_error = str(exc) or exc.__class__.__name__
+                delay = min(self._seconds_until_next_run(), retry)
+                retry = min(retry * 2, RETRY_MAX_SECONDS)
+            else:
+                self.last_error = None
+                delay = self._seconds_until_next_run()
+                retry = RETRY_MIN_SECONDS
+
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {
+            "policy": self.policy,
+            "last_run": self.last_run,
+            "last_closed": self.last_closed,
+            "total_closed": self.total_closed,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+auto_close = AutoCloseTask(
+    policy=settings.AUTO_CLOSE_POLICY,
+    run_at=settings.AUTO_CLOSE_TIME,
+    batch_size=settings.AUTO_CLOSE_BATCH_SIZE,
+)
@@ -0,0 +1,54 @@
+from datetime import date
+
+from app.core.response_cache import response_cache
+
+# Cached responses:
+#   summary:{YYYY-MM}:user:{id}  /attendances/summary (closed months only)
+#   summary:{YYYY-MM}:all        /admin/attendance/summary (closed months only)
+#   months:user:{id}             /attendances/months
+#   months:all                   /admin/attendance/months
+
+
+def summary_key(month: str, user_id: int | None = None) -> str:
+    # Writes invalidate zero-padded months, so ?month=2025-1 must share
+    # the 2025-01 entry
+    year, month_num = map(int, month.split("-"))
+    scope = f"user:{user_id}" if user_id is not None else "all"
+    return f"summary:{year}-{month_num:02d}:{scope}"
+
+
+def months_key(user_id: int | None = None) -> str:
+    return f"months:user:{user_id}" if user_id is not None else "months:all"
+
+
+async def invalidate_attendance(user_id: int, attendance_date: date) -> None:
+    month = attendance_date.strftime("%Y-%m")
+
+    await response_cache.delete(
+        summary_key(month, user_id),
+        summary_key(month),
+        months_key(user_id),
+        months_key(),
+    )
+
+
+async def invalidate_month(day: date) -> None:
+    """Holiday changes affect every user's summary for that month."""
+    await response_cache.delete_prefix(f"summary:{day.strftime('%Y-%m')}:")
+
+
+async def invalidate_bulk(user_ids: set[int], months: set[str]) -> None:
+    """Imports and the nightly auto-close touch many users and months at once."""
+    for month in sorted(months):
+        await response_cache.delete_prefix(f"summary:{month}:")
+
+    await response_cache.delete(
+        *(months_key(user_id) for user_id in user_ids),
+        months_key(),
+    )
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Admin summaries embed user names and rates."""
+    await response_cache.delete_prefix("summary:")
+    await response_cache.delete(months_key(user_id), months_key())
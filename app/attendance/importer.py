@@ -0,0 +1,211 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterator
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException, status
+
+from app.core.enums import ImportFormat
+
+IST = ZoneInfo("Asia/Kolkata")
+MAX_REPORTED_ERRORS = 1000
+# users.id is an int4
+MAX_USER_ID = 2**31 - 1
+# Terminal clocks drift, allow a little slack before calling it the future
+CLOCK_SKEW = timedelta(minutes=5)
+
+
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    """Split a streamed body into lines, one list per received chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+
+    try:
+        async for chunk in chunks:
+            lines = (tail + decoder.decode(chunk)).split("\n")
+            tail = lines.pop()
+            if lines:
+                yield lines
+
+        tail += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Punch log must be UTF-8"
+        )
+
+    if tail:
+        yield [tail]
+
+
+async def read_records(
+    chunks: AsyncIterator[bytes],
+    fmt: ImportFormat,
+) -> AsyncIterator[tuple[int, dict | None]]:
+    """
+    Yield (line number, record) for every non-blank line. The record is
+    None when the line cannot be parsed at all.
+    """
+    number = 0
+    header = None
+
+    async for lines in read_lines(chunks):
+        if fmt == ImportFormat.NDJSON:
+            for line in lines:
+                number += 1
+                if not line.strip():
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+
+                yield number, record if isinstance(record, dict) else None
+            continue
+
+        for row in csv.reader(lines):
+            number += 1
+            if not row:
+                continue
+
+            if header is None:
+                header = [column.strip().lower() for column in row]
+                if "user_id" not in header or "timestamp" not in header:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="CSV header must include user_id and timestamp"
+                    )
+                continue
+
+            # Trailing empty columns are often left out
+            yield number, dict(zip(header, row)) if len(row) <= len(header) else None
+
+
+def parse_user_id(value) -> int | None:
+    """A positive int4 from a JSON number or CSV cell, else None."""
+    if isinstance(value, str):
+        try:
+            value = int(value.strip())
+        except ValueError:
+            return None
+
+    # bool is an int, and 1.9 should not quietly become user 1
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+
+    return value if 1 <= value <= MAX_USER_ID else None
+
+
+@dataclass(slots=True)
+class _Day:
+    first: datetime
+    last: datetime
+    first_in: datetime | None = None
+    last_out: datetime | None = None
+
+
+@dataclass
+class PunchLog:
+    """
+    Punches grouped per user and IST day.
+
+    The day's clock-in is its earliest "in" punch and the clock-out its
+    latest "out" punch. When the terminal does not log directions, the
+    first punch is the clock-in and the last one the clock-out. A day
+    with a single punch stays open. Punches older than `max_age` are
+    rejected.
+    """
+    now: datetime
+    max_age: timedelta
+    days: dict[tuple[int, date], _Day] = field(default_factory=dict)
+    rows_by_user: dict[int, list[int]] = field(default_factory=dict)
+    errors: list[dict] = field(default_factory=list)
+    received: int = 0
+    failed: int = 0
+
+    def error(self, row: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": message})
+
+    def add(self, row: int, record: dict | None) -> None:
+        self.received += 1
+
+        if record is None:
+            return self.error(row, "Malformed line")
+
+        user_id = parse_user_id(record.get("user_id"))
+        if user_id is None:
+            return self.error(row, "Invalid user_id")
+
+        try:
+            punched_at = datetime.fromisoformat(str(record.get("timestamp")).strip())
+        except ValueError:
+            return self.error(row, "Invalid timestamp, expected ISO 8601")
+
+        # Terminals log local time
+        if punched_at.tzinfo is None:
+            punched_at = punched_at.replace(tzinfo=IST)
+
+        if punched_at > self.now + CLOCK_SKEW:
+            return self.error(row, "Timestamp is in the future")
+
+        if punched_at < self.now - self.max_age:
+            return self.error(row, "Timestamp is too old")
+
+        direction = str(record.get("direction") or "").strip().lower()
+        if direction not in ("", "in", "out"):
+            return self.error(row, "Invalid direction, expected in or out")
+
+        key = (user_id, punched_at.astimezone(IST).date())
+        day = self.days.get(key)
+
+        if day is None:
+            day = self.days[key] = _Day(first=punched_at, last=punched_at)
+        else:
+            day.first = min(day.first, punched_at)
+            day.last = max(day.last, punched_at)
+
+        if direction == "in" and (day.first_in is None or punched_at < day.first_in):
+            day.first_in = punched_at
+        elif direction == "out" and (day.last_out is None or punched_at > day.last_out):
+            day.last_out = punched_at
+
+        self.rows_by_user.setdefault(user_id, []).append(row)
+
+    @property
+    def user_ids(self) -> set[int]:
+        return set(self.rows_by_user)
+
+    def drop_users(self, user_ids: set[int]) -> None:
+        """Reject every punch of users that do not exist."""
+        if not user_ids:
+            return
+
+        rejected = [
+            row for user_id in user_ids for row in self.rows_by_user.pop(user_id)
+        ]
+        for row in sorted(rejected):
+            self.error(row, "Unknown user_id")
+
+        self.days = {
+            key: day for key, day in self.days.items() if key[0] not in user_ids
+        }
+
+    def paired(self) -> Iterator[tuple[int, date, datetime, datetime | None]]:
+        for (user_id, attendance_date), day in self.days.items():
+            clock_in = day.first_in or day.first
+
+            if day.first_in or day.last_out:
+                clock_out = day.last_out
+            else:
+                clock_out = day.last
+
+            if clock_out and clock_out <= clock_in:
+                clock_out = None
+
+            yield user_id, attendance_date, clock_in, clock_out
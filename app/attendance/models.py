@@ -6,7 +6,11 @@ from sqlalchemy import (
     Date,
     DateTime,
     Boolean,
-    Integer
+    Integer,
+    Index,
+    UniqueConstraint,
+    false,
+    text
 )
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 from sqlalchemy.sql import func
@@ -17,10 +21,31 @@ from app.users.models import User
 
 class Attendance(BaseModel):
     __tablename__ = "attendance"
+    __table_args__ = (
+        # one row per user per day, also serves per-user date ranges
+        Index(
+            "ux_attendance_user_id_attendance_date",
+            "user_id",
+            "attendance_date",
+            unique=True
+        ),
+        # all-user date ranges (payroll, exports)
+        Index(
+            "ix_attendance_attendance_date_user_id",
+            "attendance_date",
+            "user_id"
+        ),
+        # open days the nightly auto-close has not swept yet
+        Index(
+            "ix_attendance_open",
+            "attendance_date",
+            "id",
+            postgresql_where=text("clock_out IS NULL AND NOT missing_clock_out")
+        ),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         nullable=False
     )
 
@@ -54,7 +79,14 @@ class Attendance(BaseModel):
 
     attendance_date: Mapped[date] = mapped_column(
         Date,
-        index=True,
+        nullable=False
+    )
+
+    # set by the nightly auto-close, cleared once a real clock-out is recorded
+    missing_clock_out: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        server_default=false(),
         nullable=False
     )
 
@@ -97,3 +129,56 @@ class AttendanceAudit(BaseModel):
     )
 
     attendance = relationship("Attendance")
+
+
+class AttendanceMonthlyRollup(BaseModel):
+    __tablename__ = "attendance_monthly_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "month",
+            name="uq_attendance_monthly_rollup_user_month"
+        ),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # first day of the month
+    month: Mapped[date] = mapped_column(
+        Date,
+        index=True,
+        nullable=False
+    )
+
+    total_minutes: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False
+    )
+
+    overtime_minutes: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False
+    )
+
+    present_days: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False
+    )
+
+    missing_clock_outs: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
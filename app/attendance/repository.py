@@ -1,19 +1,18 @@
-from datetime import datetime, date, timezone
-from calendar import monthrange
+from datetime import datetime, date, timedelta
 
-from sqlalchemy import select, outerjoin, func, extract, and_, or_, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, outerjoin, func, delete, case, cast, literal, null, tuple_, Date, DateTime, Integer
+from sqlalchemy.dialects.postgresql import insert
 
-from app.attendance.models import Attendance
+from app.attendance.models import Attendance, AttendanceMonthlyRollup
 from app.users.models import User
 from app.holidays.models import PaidHoliday
+from app.holidays.calendar import holiday_calendar
 from app.core.enums import UserRole
+from app.core.repository import BaseRepository
+from app.utils.date_utils import get_month_range
 
 
-class AttendanceRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
-
+class AttendanceRepository(BaseRepository):
     async def get_by_id(self, attendance_id: int):
         stmt = (
             select(Attendance)
@@ -37,16 +36,194 @@ class AttendanceRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def create(self, attendance: Attendance):
-        self.session.add(attendance)
-        await self.session.commit()
-        await self.session.refresh(attendance)
-        return attendance
+    async def clock_in(
+        self,
+        user_id: int,
+        clock_in: datetime,
+        attendance_date: date,
+    ) -> Attendance | None:
+        # Returns None when the user already has a row for that day
+        stmt = (
+            insert(Attendance)
+            .values(
+                user_id=user_id,
+                clock_in=clock_in,
+                attendance_date=attendance_date,
+                is_manual=False,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Attendance.user_id, Attendance.attendance_date]
+            )
+            .returning(Attendance)
+        )
 
-    async def update(self, attendance: Attendance):
-        await self.session.commit()
-        await self.session.refresh(attendance)
-        return attendance
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def clock_out(
+        self,
+        user_id: int,
+        today: date,
+        clock_out: datetime,
+        standard_minutes: int,
+    ) -> Attendance | None:
+        # Returns None when there is no open row for today
+        worked_minutes = func.greatest(
+            cast(
+                func.floor(
+                    func.extract(
+                        "epoch",
+                        literal(clock_out, DateTime(timezone=True)) - Attendance.clock_in,
+                    ) / 60
+                ),
+                Integer,
+            ),
+            0,
+        )
+
+        stmt = (
+            update(Attendance)
+            .where(
+                Attendance.user_id == user_id,
+                Attendance.attendance_date == today,
+                Attendance.clock_out.is_(None),
+            )
+            .values(
+                clock_out=clock_out,
+                total_minutes=worked_minutes,
+                overtime_minutes=func.greatest(worked_minutes - standard_minutes, 0),
+                missing_clock_out=False,
+            )
+            .returning(Attendance)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def bulk_update(self, values: list[dict]) -> None:
+        """UPDATE by primary key, one executemany for all rows."""
+        if values:
+            await self.session.execute(update(Attendance), values)
+
+    async def bulk_insert(self, values: list[dict]) -> list[int]:
+        """Multi-row INSERT ... RETURNING id, ids in input order."""
+        if not values:
+            return []
+
+        result = await self.session.execute(
+            insert(Attendance).returning(
+                Attendance.id, sort_by_parameter_order=True
+            ),
+            values,
+        )
+        return result.scalars().all()
+
+    async def upsert_punches(self, values: list[dict], standard_minutes: int) -> None:
+        """
+        Multi-row INSERT ... ON CONFLICT for imported days. A day that
+        already exists keeps its earliest clock-in and latest clock-out,
+        so importing the same log twice changes nothing.
+        """
+        if not values:
+            return
+
+        stmt = insert(Attendance).values(values)
+
+        # greatest()/least() skip NULLs, an open day takes the new clock-out.
+        # A real out punch replaces a clock-out made up by the auto-close.
+        clock_in = func.least(Attendance.clock_in, stmt.excluded.clock_in)
+        clock_out = case(
+            (
+                Attendance.missing_clock_out & stmt.excluded.clock_out.is_not(None),
+                stmt.excluded.clock_out,
+            ),
+            else_=func.greatest(Attendance.clock_out, stmt.excluded.clock_out),
+        )
+        worked_minutes = case(
+            (clock_out.is_(None), null()),
+            else_=func.greatest(
+                cast(
+                    func.floor(func.extract("epoch", clock_out - clock_in) / 60),
+                    Integer,
+                ),
+                0,
+            ),
+        )
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Attendance.user_id, Attendance.attendance_date],
+            set_={
+                "clock_in": clock_in,
+                "clock_out": clock_out,
+                "total_minutes": worked_minutes,
+                "overtime_minutes": func.greatest(worked_minutes - standard_minutes, 0),
+                # Still open: keep the sweep's flag, or take the import's
+                # for a past day the sweep has not reached yet
+                "missing_clock_out": (
+                    (Attendance.missing_clock_out & stmt.excluded.clock_out.is_(None))
+                    | (clock_out.is_(None) & stmt.excluded.missing_clock_out)
+                ),
+                "updated_at": func.now(),
+            },
+        )
+
+        await self.session.execute(stmt)
+
+    async def close_open_days(
+        self,
+        before: date,
+        limit: int,
+        cap_minutes: int | None = None,
+    ):
+        """
+        Flag up to `limit` days before `before` that were never clocked
+        out, oldest first. With cap_minutes the day is also closed at
+        clock-in + cap_minutes. Returns the rows it changed.
+        """
+        # Matches the ix_attendance_open predicate, rows locked by another
+        # sweeper are left to it
+        batch = (
+            select(Attendance.id)
+            .where(
+                Attendance.clock_out.is_(None),
+                ~Attendance.missing_clock_out,
+                Attendance.attendance_date < before,
+            )
+            .order_by(Attendance.attendance_date, Attendance.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        values = {"missing_clock_out": True}
+        if cap_minutes is not None:
+            values.update(
+                clock_out=Attendance.clock_in + timedelta(minutes=cap_minutes),
+                total_minutes=cap_minutes,
+                overtime_minutes=0,
+            )
+
+        stmt = (
+            update(Attendance)
+            .where(Attendance.id.in_(batch.scalar_subquery()))
+            .values(**values)
+            .returning(
+                Attendance.id,
+                Attendance.user_id,
+                Attendance.attendance_date,
+                Attendance.clock_in,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def get_existing_user_ids(self, user_ids: set[int]) -> set[int]:
+        stmt = select(User.id).where(User.id.in_(sorted(user_ids)))
+
+        res = await self.session.execute(stmt)
+        return set(res.scalars().all())
 
     async def get_today_attendance_all_users(self, today: date):
         stmt = (
@@ -71,58 +248,49 @@ class AttendanceRepository:
         result = await self.session.execute(stmt)
         return result.mappings().all()
     
-    async def get_latest_month_with_data(
+    async def get_attendance_page(
         self,
         user_id: int,
-        before_year: int,
-        before_month: int,
-    ):
+        limit: int,
+        after: tuple[date, int] | None = None,
+    ) -> list[Attendance]:
+        """
+        Newest first, keyset paginated on (attendance_date, id). One range
+        scan of ux_attendance_user_id_attendance_date per page; a user has
+        one row per day, so id only breaks ties defensively.
+        """
         stmt = (
-            select(
-                extract("year", Attendance.attendance_date).label("year"),
-                extract("month", Attendance.attendance_date).label("month"),
-            )
-            .where(
-                Attendance.user_id == user_id,
-                or_(
-                    extract("year", Attendance.attendance_date) < before_year,
-                    and_(
-                        extract("year", Attendance.attendance_date) == before_year,
-                        extract("month", Attendance.attendance_date) <= before_month,
-                    ),
-                ),
-            )
-            .group_by("year", "month")
-            .order_by(desc("year"), desc("month"))
-            .limit(1)
+            select(Attendance)
+            .where(Attendance.user_id == user_id)
+            .order_by(Attendance.attendance_date.desc(), Attendance.id.desc())
+            .limit(limit)
         )
 
-        row = (await self.session.execute(stmt)).first()
-        return row
-    
+        if after:
+            stmt = stmt.where(
+                tuple_(Attendance.attendance_date, Attendance.id) < tuple_(*after)
+            )
+
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def get_attendance_by_month(
         self,
         user_id: int,
         year: int,
         month: int,
     ):
-        start = datetime(year, month, 1, tzinfo=timezone.utc)
-        end = datetime(
-            year,
-            month,
-            monthrange(year, month)[1],
-            23, 59, 59,
-            tzinfo=timezone.utc
-        )
+        # IST days, like every other attendance query
+        start, end = get_month_range(year, month)
 
         stmt = (
             select(Attendance)
             .where(
                 Attendance.user_id == user_id,
-                Attendance.clock_in >= start,
-                Attendance.clock_in <= end,
+                Attendance.attendance_date >= start,
+                Attendance.attendance_date < end,
             )
-            .order_by(Attendance.clock_in.desc())
+            .order_by(Attendance.attendance_date.desc())
         )
 
         result = await self.session.execute(stmt)
@@ -153,9 +321,7 @@ class AttendanceRepository:
             Attendance.user_id == user_id,
             Attendance.attendance_date >= start,
             Attendance.attendance_date < end,
-            Attendance.clock_in.is_not(None),
-            Attendance.clock_out.is_(None),
-            Attendance.attendance_date < date.today(),  # exclude today
+            Attendance.missing_clock_out,
         )
 
         res = await self.session.execute(stmt)
@@ -166,14 +332,18 @@ class AttendanceRepository:
         start: date,
         end: date,
     ) -> set[date]:
+        return await holiday_calendar.between(
+            start, end, self._get_active_holiday_dates
+        )
+
+    async def _get_active_holiday_dates(self, year: int) -> list[date]:
         stmt = select(PaidHoliday.date).where(
-            PaidHoliday.date >= start,
-            PaidHoliday.date < end,
+            PaidHoliday.year == year,
             PaidHoliday.is_active.is_(True),
         )
 
         res = await self.session.execute(stmt)
-        return {row[0] for row in res.all()}
+        return res.scalars().all()
 
     async def get_monthly_aggregates(
         self,
@@ -197,47 +367,295 @@ class AttendanceRepository:
             "total_minutes": total_minutes,
             "overtime_minutes": overtime_minutes,
         }
-    
-    async def get_available_months_by_user_id(self, user_id: int) -> list[str]:
-        month_expr = func.to_char(
-            func.date_trunc('month', Attendance.clock_in),
-            'YYYY-MM'
-        )
+
+    async def get_monthly_breakdown(
+        self,
+        user_id: int,
+        start: date,
+        effective_end: date,
+        paid_holiday_dates: set[date],
+    ):
+        """One user's totals and present days for every month in range."""
+        month_expr = cast(func.date_trunc("month", Attendance.attendance_date), Date)
 
         stmt = (
-            select(month_expr.label('month'))
-            .where(Attendance.user_id == user_id)
+            select(
+                month_expr.label("month"),
+                func.coalesce(func.sum(Attendance.total_minutes), 0).label("total_minutes"),
+                func.coalesce(func.sum(Attendance.overtime_minutes), 0).label("overtime_minutes"),
+                func.count(Attendance.attendance_date.distinct()).label("present_days"),
+                func.count(Attendance.attendance_date.distinct())
+                .filter(Attendance.attendance_date.in_(sorted(paid_holiday_dates)))
+                .label("present_on_holidays"),
+            )
+            .where(
+                Attendance.user_id == user_id,
+                Attendance.attendance_date >= start,
+                Attendance.attendance_date < effective_end,
+            )
             .group_by(month_expr)
-            .order_by(month_expr.desc())
         )
 
-        result = await self.session.execute(stmt)
-        return [row.month for row in result.all()]
+        res = await self.session.execute(stmt)
+        return res.all()
+
+    async def get_payroll_aggregates(
+        self,
+        start: date,
+        effective_end: date,
+        end: date,
+        paid_holiday_dates: set[date],
+    ):
+        # One grouped scan for every user in the month. Totals and present
+        # days stop at effective_end, missing clock-outs use the full month.
+        in_window = Attendance.attendance_date < effective_end
+
+        stmt = (
+            select(
+                Attendance.user_id,
+                func.coalesce(
+                    func.sum(Attendance.total_minutes).filter(in_window), 0
+                ).label("total_minutes"),
+                func.coalesce(
+                    func.sum(Attendance.overtime_minutes).filter(in_window), 0
+                ).label("overtime_minutes"),
+                func.count(Attendance.attendance_date.distinct())
+                .filter(in_window)
+                .label("present_days"),
+                func.count(Attendance.attendance_date.distinct())
+                .filter(
+                    in_window,
+                    Attendance.attendance_date.in_(sorted(paid_holiday_dates)),
+                )
+                .label("present_on_holidays"),
+                # flagged by the nightly auto-close
+                func.count()
+                .filter(Attendance.missing_clock_out)
+                .label("missing_clock_outs"),
+            )
+            .where(
+                Attendance.attendance_date >= start,
+                Attendance.attendance_date < end,
+            )
+            .group_by(Attendance.user_id)
+        )
+
+        res = await self.session.execute(stmt)
+        return res.all()
     
-    async def get_available_months_all_users(self) -> list[str]:
-        month_expr = func.to_char(
-            func.date_trunc('month', Attendance.clock_in),
-            'YYYY-MM'
+    def _available_months(self, user_id: int | None = None):
+        # Loose index scan: jump from month to month with one
+        # max(attendance_date) probe each instead of grouping every row
+        def month_before(bound=None):
+            stmt = select(
+                cast(
+                    func.date_trunc("month", func.max(Attendance.attendance_date)),
+                    Date,
+                ).label("month")
+            )
+
+            if user_id is not None:
+                stmt = stmt.where(Attendance.user_id == user_id)
+            if bound is not None:
+                stmt = stmt.where(Attendance.attendance_date < bound)
+
+            return stmt
+
+        months = month_before().cte("months", recursive=True)
+        months = months.union_all(
+            select(month_before(months.c.month).scalar_subquery())
+            .where(months.c.month.is_not(None))
         )
 
-        stmt = (
-            select(month_expr.label('month'))
-            .group_by(month_expr)
-            .order_by(month_expr.desc())
+        return (
+            select(func.to_char(months.c.month, "YYYY-MM").label("month"))
+            .where(months.c.month.is_not(None))
+            .order_by(months.c.month.desc())
         )
 
-        result = await self.session.execute(stmt)
+    async def get_available_months_by_user_id(self, user_id: int) -> list[str]:
+        result = await self.session.execute(self._available_months(user_id))
+        return [row.month for row in result.all()]
+    
+    async def get_available_months_all_users(self) -> list[str]:
+        result = await self.session.execute(self._available_months())
         return [row.month for row in result.all()]
     
-    async def fetch_attendance_range(self, start_date, end_date):
+    async def get_attendance_range_users(self, start_date, end_date):
         stmt = (
-            select(Attendance, User)
-            .join(User)
+            select(User.id, User.name)
             .where(
-                Attendance.attendance_date.between(start_date, end_date)
+                User.id.in_(
+                    select(Attendance.user_id).where(
+                        Attendance.attendance_date.between(start_date, end_date)
+                    )
+                )
             )
-            .order_by(User.id, Attendance.attendance_date)
+            .order_by(User.id)
         )
 
         result = await self.session.execute(stmt)
-        return result.all()
\ No newline at end of file
+        return result.all()
+
+    async def fetch_attendance_range(
+        self,
+        start_date,
+        end_date,
+        chunk_size: int = 1000,
+    ):
+        # Server-side cursor, yields plain row tuples chunk by chunk
+        stmt = (
+            select(
+                Attendance.attendance_date,
+                Attendance.user_id,
+                User.name,
+                Attendance.clock_in,
+                Attendance.clock_out,
+                Attendance.total_minutes,
+                Attendance.overtime_minutes,
+            )
+            .join(User, User.id == Attendance.user_id)
+            .where(
+                Attendance.attendance_date.between(start_date, end_date)
+            )
+            .order_by(Attendance.attendance_date, Attendance.user_id)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    async def get_present_on_holidays(
+        self,
+        start: date,
+        end: date,
+        paid_holiday_dates: set[date],
+        user_id: int | None = None,
+    ) -> dict[int, int]:
+        if not paid_holiday_dates:
+            return {}
+
+        stmt = (
+            select(
+                Attendance.user_id,
+                func.count(Attendance.attendance_date.distinct()),
+            )
+            .where(
+                Attendance.attendance_date >= start,
+                Attendance.attendance_date < end,
+                Attendance.attendance_date.in_(sorted(paid_holiday_dates)),
+            )
+            .group_by(Attendance.user_id)
+        )
+
+        if user_id is not None:
+            stmt = stmt.where(Attendance.user_id == user_id)
+
+        res = await self.session.execute(stmt)
+        return {row[0]: row[1] for row in res.all()}
+
+    # -------- MONTHLY ROLLUP --------
+
+    def _rollup_upsert(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        user_ids: list[int] | None = None,
+    ):
+        month_expr = cast(func.date_trunc("month", Attendance.attendance_date), Date)
+
+        source = (
+            select(
+                Attendance.user_id,
+                month_expr,
+                func.coalesce(func.sum(Attendance.total_minutes), 0),
+                func.coalesce(func.sum(Attendance.overtime_minutes), 0),
+                func.count(Attendance.attendance_date.distinct()),
+                func.count().filter(Attendance.missing_clock_out),
+            )
+            .group_by(Attendance.user_id, month_expr)
+        )
+
+        if start is not None:
+            source = source.where(Attendance.attendance_date >= start)
+        if end is not None:
+            source = source.where(Attendance.attendance_date < end)
+        if user_ids is not None:
+            source = source.where(Attendance.user_id.in_(user_ids))
+
+        stmt = insert(AttendanceMonthlyRollup).from_select(
+            [
+                "user_id",
+                "month",
+                "total_minutes",
+                "overtime_minutes",
+                "present_days",
+                "missing_clock_outs",
+            ],
+            source,
+        )
+
+        return stmt.on_conflict_do_update(
+            constraint="uq_attendance_monthly_rollup_user_month",
+            set_={
+                "total_minutes": stmt.excluded.total_minutes,
+                "overtime_minutes": stmt.excluded.overtime_minutes,
+                "present_days": stmt.excluded.present_days,
+                "missing_clock_outs": stmt.excluded.missing_clock_outs,
+                "updated_at": func.now(),
+            },
+        )
+
+    async def refresh_monthly_rollup(self, user_id: int, attendance_date: date):
+        start, end = get_month_range(attendance_date.year, attendance_date.month)
+
+        await self.session.execute(self._rollup_upsert(start, end, [user_id]))
+
+    async def refresh_monthly_rollups(self, days: set[tuple[int, date]]):
+        """
+        Upsert the rollups of the (user, month) pairs the given (user_id,
+        attendance_date) days fall in, one statement per month.
+        """
+        months: dict[date, set[int]] = {}
+        for user_id, attendance_date in days:
+            months.setdefault(attendance_date.replace(day=1), set()).add(user_id)
+
+        for month, user_ids in sorted(months.items()):
+            start, end = get_month_range(month.year, month.month)
+            await self.session.execute(
+                self._rollup_upsert(start, end, sorted(user_ids))
+            )
+
+    async def rebuild_monthly_rollups(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+    ):
+        stmt = delete(AttendanceMonthlyRollup)
+
+        if start is not None:
+            stmt = stmt.where(AttendanceMonthlyRollup.month >= start)
+        if end is not None:
+            stmt = stmt.where(AttendanceMonthlyRollup.month < end)
+
+        await self.session.execute(stmt)
+        await self.session.execute(self._rollup_upsert(start, end))
+        await self.session.commit()
+
+    async def get_monthly_rollup(self, user_id: int, month: date):
+        stmt = select(AttendanceMonthlyRollup).where(
+            AttendanceMonthlyRollup.user_id == user_id,
+            AttendanceMonthlyRollup.month == month,
+        )
+
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
+    async def get_monthly_rollups(self, month: date):
+        stmt = select(AttendanceMonthlyRollup).where(
+            AttendanceMonthlyRollup.month == month,
+        )
+
+        res = await self.session.execute(stmt)
+        return res.scalars().all()
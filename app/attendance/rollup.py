@@ -0,0 +1,35 @@
+"""Rebuild the attendance monthly rollup table.
+
+Usage:
+    python -m app.attendance.rollup             # every month
+    python -m app.attendance.rollup 2025-12     # a single month
+"""
+import argparse
+import asyncio
+
+from app.core.database import DbSession, close_orm
+from app.attendance.repository import AttendanceRepository
+from app.utils.date_utils import get_month_range
+
+
+async def rebuild(month: str | None = None):
+    start = end = None
+
+    if month:
+        year, month_num = map(int, month.split("-"))
+        start, end = get_month_range(year, month_num)
+
+    async with DbSession() as session:
+        repo = AttendanceRepository(session)
+        await repo.rebuild_monthly_rollups(start, end)
+
+    await close_orm()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild attendance monthly rollups")
+    parser.add_argument("month", nargs="?", help="Month in YYYY-MM format")
+    args = parser.parse_args()
+
+    asyncio.run(rebuild(args.month))
+    print("rollup rebuilt")
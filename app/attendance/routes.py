@@ -1,14 +1,18 @@
 from typing import List
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.attendance.schemas import AttendanceResponseSchema, AttendanceSummaryResponse
 from app.attendance.dependencies import AttendanceServiceDep
+from app.attendance.cache import summary_key, months_key
 from app.auth.dependencies import get_current_user
 from app.users.models import User
-from app.utils.date_utils import resolve_date_range
+from app.core.enums import ExportFormat
+from app.core.response_cache import response_cache
+from app.core.responses import FastJSONResponse
+from app.utils.date_utils import resolve_date_range, is_closed_month
+from app.utils.export import export_response
 
 
 router = APIRouter(prefix="/attendances", tags=["attendances"])
@@ -45,17 +49,26 @@ async def clock_out(
 
 
 @router.get("/my")
-async def my_attendance_by_month(
+async def my_attendance(
     service: AttendanceServiceDep,
     cursor: str | None = Query(
         default=None,
-        description="Month cursor in YYYY-MM format"
+        description="next_cursor from the previous page"
+    ),
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=200,
+        description="Days per page, defaults to ATTENDANCE_PAGE_SIZE"
     ),
     user: User = Depends(get_current_user),
 ):
-    return await service.get_attendance_by_month(
-        user.id,
-        cursor=cursor,
+    return FastJSONResponse(
+        await service.get_attendance_page(
+            user.id,
+            cursor=cursor,
+            limit=limit,
+        )
     )
 
 @router.get(
@@ -63,36 +76,63 @@ async def my_attendance_by_month(
     response_model=AttendanceSummaryResponse
 )
 async def get_attendance_summary(
+    request: Request,
     service: AttendanceServiceDep,
     month: str = Query(..., example="2025-12"),
     user: User = Depends(get_current_user),
 ):
-    return await service.get_monthly_summary(user.id, month)
+    async def produce():
+        summary = await service.get_monthly_summary(user.id, month)
+        return AttendanceSummaryResponse(**summary)
+
+    key = summary_key(month, user.id) if is_closed_month(month) else None
+    return await response_cache.respond(request, key, produce)
+
+@router.get(
+    "/summary/range",
+    response_model=List[AttendanceSummaryResponse]
+)
+async def get_attendance_summary_range(
+    service: AttendanceServiceDep,
+    start: str = Query(..., example="2025-01", description="First month, YYYY-MM"),
+    end: str | None = Query(
+        default=None,
+        example="2025-12",
+        description="Last month, YYYY-MM, defaults to the current month"
+    ),
+    user: User = Depends(get_current_user),
+):
+    return await service.get_monthly_summary_range(user.id, start, end)
 
 @router.get("/attendance/export/excel")
 async def export_attendance_excel(
     service: AttendanceServiceDep,
     start_date: date | None = None,
     end_date: date | None = None,
+    fmt: ExportFormat = Query(
+        default=ExportFormat.XLSX,
+        alias="format",
+        description="xlsx, csv or parquet"
+    ),
 ):
     start_date, end_date = resolve_date_range(start_date, end_date)
 
-    excel_buffer = await service.export_attendance_excel(
+    content = await service.export_attendance(
         start_date=start_date,
         end_date=end_date,
+        fmt=fmt,
     )
 
-    return StreamingResponse(
-        excel_buffer,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename=attendance_{start_date}_{end_date}.xlsx"
-        },
-    )
+    return export_response(content, fmt, start_date, end_date)
 
 @router.get("/months", response_model=List[str])
 async def get_attendance_summary_months(
+    request: Request,
     service: AttendanceServiceDep,
     user: User = Depends(get_current_user),
 ):
-    return await service.get_available_months_by_user_id(user.id)
+    return await response_cache.respond(
+        request,
+        months_key(user.id),
+        lambda: service.get_available_months_by_user_id(user.id),
+    )
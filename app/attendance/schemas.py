@@ -12,6 +12,7 @@ class AttendanceResponseSchema(BaseModel):
     total_minutes: Optional[int]
     overtime_minutes: Optional[int]
     is_manual: bool
+    missing_clock_out: bool = False
 
     class Config:
         from_attributes = True
@@ -41,4 +42,15 @@ class TodayAttendanceAdminResponse(BaseModel):
     attendance_id: int | None
     clock_in: datetime | None
     user_id: int
-    user_name: str
\ No newline at end of file
+    user_name: str
+
+class AttendanceImportError(BaseModel):
+    row: int
+    error: str
+
+class AttendanceImportResponse(BaseModel):
+    received: int
+    imported: int
+    failed: int
+    days: int
+    errors: list[AttendanceImportError]
@@ -1,19 +1,35 @@
 import calendar
-from calendar import month_name
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from typing import AsyncIterator
 from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException, status
 
-from app.attendance.models import Attendance
 from app.attendance.repository import AttendanceRepository
+from app.attendance.cache import invalidate_attendance, invalidate_bulk
+from app.attendance.importer import PunchLog, read_records
+from app.admin.dashboard import dashboard_live
 from app.admin.schemas import AdminTimeEditSchema
 from app.utils.date_utils import get_month_range
-from app.utils.excel import create_attendance_excel
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.core.config import settings
+from app.core.enums import ExportFormat, ImportFormat
+from app.utils.excel import write_attendance_excel
+from app.utils.export import write_attendance_csv, write_attendance_parquet
+from app.utils.streaming import stream_from_thread
 
 STANDARD_WORK_MINUTES = (8 * 60) + 30
+MAX_SUMMARY_MONTHS = 24
 IST = ZoneInfo("Asia/Kolkata")
 
+
+def worked_minutes(clock_in: datetime, clock_out: datetime) -> tuple[int, int]:
+    """Worked and overtime minutes, the same rule clock_out applies in SQL."""
+    total = max(0, int((clock_out - clock_in).total_seconds() // 60))
+    return total, max(0, total - STANDARD_WORK_MINUTES)
+
+
 class AttendanceService:
     def __init__(
         self, 
@@ -21,26 +37,6 @@ class AttendanceService:
     ):
         self.attendance_repo = attendance_repo
 
-    def _group_by_user(self, rows):
-        data = {}
-
-        for attendance, user in rows:
-            if user.id not in data:
-                data[user.id] = {
-                    "name": user.name,
-                    "records": []
-                }
-
-            data[user.id]["records"].append({
-                "date": attendance.attendance_date,
-                "in_time": attendance.clock_in,
-                "out_time": attendance.clock_out,
-                "total_minutes": attendance.total_minutes,
-                "ot_minutes": attendance.overtime_minutes,
-            })
-
-        return data
-
     async def today_attendace(self, user_id: int):
         today = date.today()
         return await self.attendance_repo.get_today_attendance(user_id, today)
@@ -50,56 +46,60 @@ class AttendanceService:
         return await self.attendance_repo.get_today_attendance_all_users(today)
 
     async def clock_in(self, user_id: int):
-        today = date.today()
-        today_attendance = await self.attendance_repo.get_today_attendance(user_id, today)
+        clock_in = datetime.now(timezone.utc)
+
+        # Single INSERT ... ON CONFLICT DO NOTHING RETURNING
+        attendance = await self.attendance_repo.clock_in(
+            user_id,
+            clock_in=clock_in,
+            attendance_date=clock_in.astimezone(IST).date(),
+        )
 
-        if today_attendance:
+        if not attendance:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Already clocked in today"
             )
-        
-        clock_in=datetime.now(timezone.utc)
-        
-        attendance = Attendance(
-            user_id=user_id,
-            clock_in=clock_in,
-            attendance_date=clock_in.astimezone(IST).date(),
-            is_manual=False
+
+        await self.attendance_repo.refresh_monthly_rollup(
+            user_id, attendance.attendance_date
         )
-        return await self.attendance_repo.create(attendance)
+        await self.attendance_repo.commit()
+        await invalidate_attendance(user_id, attendance.attendance_date)
+        await dashboard_live.attendance_changed(attendance)
+        return attendance
 
     async def clock_out(self, user_id: int):
         today = date.today()
-        attendance = await self.attendance_repo.get_today_attendance(user_id, today)
+
+        # Single UPDATE ... WHERE clock_out IS NULL RETURNING,
+        # worked/overtime minutes are computed in SQL
+        attendance = await self.attendance_repo.clock_out(
+            user_id,
+            today=today,
+            clock_out=datetime.now(timezone.utc),
+            standard_minutes=STANDARD_WORK_MINUTES,
+        )
 
         if not attendance:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You have not clocked in today"
-            )
+            if not await self.attendance_repo.get_today_attendance(user_id, today):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="You have not clocked in today"
+                )
 
-        if attendance.clock_out:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Already clocked out"
             )
 
-        now = datetime.now(timezone.utc)
-        attendance.clock_out = now
-
-        worked_minutes = int(
-            (now - attendance.clock_in).total_seconds() // 60
-        )
-        worked_minutes = max(worked_minutes, 0)
-
-        attendance.total_minutes = worked_minutes
-        attendance.overtime_minutes = max(
-            0,
-            worked_minutes - STANDARD_WORK_MINUTES
+        await self.attendance_repo.refresh_monthly_rollup(
+            user_id, attendance.attendance_date
         )
-
-        return await self.attendance_repo.update(attendance)
+        await self.attendance_repo.commit()
+        await invalidate_attendance(user_id, attendance.attendance_date)
+        await dashboard_live.attendance_changed(attendance)
+        return attendance
     
     async def edit_attendance_time(
         self,
@@ -120,6 +120,7 @@ class AttendanceService:
 
         if payload.clock_out:
             attendance.clock_out = payload.clock_out
+            attendance.missing_clock_out = False
 
         # Validate time order
         if attendance.clock_in and attendance.clock_out:
@@ -128,57 +129,112 @@ class AttendanceService:
                     400, "Clock-out must be after clock-in"
                 )
 
-            attendance.total_minutes = int(
-                (attendance.clock_out - attendance.clock_in).total_seconds() // 60
-            )
-            attendance.overtime_minutes = max(
-                0, attendance.total_minutes - STANDARD_WORK_MINUTES
+            attendance.total_minutes, attendance.overtime_minutes = worked_minutes(
+                attendance.clock_in, attendance.clock_out
             )
 
         attendance.is_manual = True
         await self.attendance_repo.update(attendance)
 
+        await self.attendance_repo.refresh_monthly_rollup(
+            attendance.user_id, attendance.attendance_date
+        )
+        await self.attendance_repo.commit()
+        await invalidate_attendance(attendance.user_id, attendance.attendance_date)
+        await dashboard_live.attendance_changed(attendance)
+
         return attendance
     
-    async def get_attendance_by_month(
+    async def import_punches(
         self,
-        user_id: int,
-        cursor: str | None = None,
+        chunks: AsyncIterator[bytes],
+        fmt: ImportFormat,
     ):
-        if cursor:
-            year, month = map(int, cursor.split("-"))
-        else:
-            now = datetime.now(timezone.utc)
-            year, month = now.year, now.month
-
-        # 🔑 Find the nearest month that actually has data
-        latest = await self.attendance_repo.get_latest_month_with_data(
-            user_id=user_id,
-            before_year=year,
-            before_month=month,
+        log = PunchLog(
+            now=datetime.now(timezone.utc),
+            max_age=timedelta(days=settings.ATTENDANCE_IMPORT_MAX_AGE_DAYS),
         )
+        today = log.now.astimezone(IST).date()
+
+        async for row, record in read_records(chunks, fmt):
+            log.add(row, record)
+
+        if log.user_ids:
+            known = await self.attendance_repo.get_existing_user_ids(log.user_ids)
+            log.drop_users(log.user_ids - known)
+
+        values = []
+        for user_id, attendance_date, clock_in, clock_out in log.paired():
+            total = overtime = None
+            if clock_out:
+                total, overtime = worked_minutes(clock_in, clock_out)
+
+            values.append({
+                "user_id": user_id,
+                "attendance_date": attendance_date,
+                "clock_in": clock_in,
+                "clock_out": clock_out,
+                "total_minutes": total,
+                "overtime_minutes": overtime or 0,
+                "is_manual": False,
+                # The nightly sweep already passed this day
+                "missing_clock_out": clock_out is None and attendance_date < today,
+            })
 
-        if not latest:
-            return None  # ⛔ No more data at all
+        # One transaction: the log is loaded completely or not at all
+        batch_size = settings.ATTENDANCE_IMPORT_BATCH_SIZE
+        for offset in range(0, len(values), batch_size):
+            await self.attendance_repo.upsert_punches(
+                values[offset:offset + batch_size], STANDARD_WORK_MINUTES
+            )
 
-        year = int(latest.year)
-        month = int(latest.month)
+        if values:
+            dates = {value["attendance_date"] for value in values}
 
-        records = await self.attendance_repo.get_attendance_by_month(
-            user_id=user_id,
-            year=year,
-            month=month,
+            await self.attendance_repo.refresh_monthly_rollups(
+                {(value["user_id"], value["attendance_date"]) for value in values}
+            )
+            await self.attendance_repo.commit()
+
+            await invalidate_bulk(
+                {value["user_id"] for value in values},
+                {day.strftime("%Y-%m") for day in dates},
+            )
+            if today in dates:
+                await dashboard_live.board_changed()
+
+        return {
+            "received": log.received,
+            "imported": log.received - log.failed,
+            "failed": log.failed,
+            "days": len(values),
+            "errors": log.errors,
+        }
+
+    async def get_attendance_page(
+        self,
+        user_id: int,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ):
+        limit = limit or settings.ATTENDANCE_PAGE_SIZE
+
+        after = None
+        if cursor:
+            after = decode_cursor(cursor, date.fromisoformat, int)
+
+        records = await self.attendance_repo.get_attendance_page(
+            user_id,
+            limit=limit,
+            after=after,
         )
 
-        # Calculate next cursor (previous month)
-        if month == 1:
-            next_cursor = f"{year - 1}-12"
-        else:
-            next_cursor = f"{year}-{month - 1:02d}"
+        next_cursor = None
+        if len(records) == limit:
+            last = records[-1]
+            next_cursor = encode_cursor(last.attendance_date, last.id)
 
         return {
-            "month": f"{month_name[month]} {year}",
-            "month_key": f"{year}-{month:02d}",
             "records": records,
             "next_cursor": next_cursor,
         }
@@ -194,7 +250,7 @@ class AttendanceService:
 
         return records
     
-    async def get_monthly_summary(self, user_id: int, month: str):
+    def _month_window(self, month: str):
         year, month_num = map(int, month.split("-"))
         start, end = get_month_range(year, month_num)
 
@@ -203,11 +259,60 @@ class AttendanceService:
 
         # ✅ Decide effective end date
         if year == today.year and month_num == today.month:
-            effective_end = today
-            effective_days = today.day
-        else:
-            effective_end = end
-            effective_days = days_in_month
+            return start, end, today, today.day
+
+        return start, end, end, days_in_month
+
+    def _build_summary(
+        self,
+        month: str,
+        total_minutes: int,
+        overtime_minutes: int,
+        present_days: int,
+        paid_holidays: int,
+        payable_days: int,
+        effective_days: int,
+    ):
+        absent_days = max(0, effective_days - payable_days)
+
+        return {
+            "month": month,
+            "totalWorkingMinutes": total_minutes,
+            "overtimeMinutes": overtime_minutes,
+            "presentDays": present_days,
+            "paidHolidays": paid_holidays,
+            "payableDays": payable_days,
+            "absentDays": absent_days,
+        }
+
+    async def get_monthly_summary(self, user_id: int, month: str):
+        start, end, effective_end, effective_days = self._month_window(month)
+
+        # Closed months are served from the rollup table
+        if end <= date.today():
+            rollup = await self.attendance_repo.get_monthly_rollup(user_id, start)
+
+            if rollup:
+                paid_holiday_dates = await self.attendance_repo.get_paid_holiday_dates(
+                    start, end
+                )
+                present_on_holidays = await self.attendance_repo.get_present_on_holidays(
+                    start, end, paid_holiday_dates, user_id
+                )
+
+                return self._build_summary(
+                    month,
+                    rollup.total_minutes,
+                    rollup.overtime_minutes,
+                    present_days=rollup.present_days,
+                    paid_holidays=len(paid_holiday_dates),
+                    payable_days=(
+                        rollup.present_days
+                        + len(paid_holiday_dates)
+                        - present_on_holidays.get(user_id, 0)
+                    ),
+                    effective_days=effective_days,
+                )
 
         # -------- DATA FETCH --------
         aggregates = await self.attendance_repo.get_monthly_aggregates(
@@ -223,23 +328,148 @@ class AttendanceService:
         )
 
         # -------- CALCULATIONS --------
-        present_days = len(attendance_dates)
-        paid_holidays = len(paid_holiday_dates)
-
         payable_dates = attendance_dates | paid_holiday_dates
-        payable_days = len(payable_dates)
 
-        absent_days = max(0, effective_days - payable_days)
+        return self._build_summary(
+            month,
+            aggregates["total_minutes"],
+            aggregates["overtime_minutes"],
+            present_days=len(attendance_dates),
+            paid_holidays=len(paid_holiday_dates),
+            payable_days=len(payable_dates),
+            effective_days=effective_days,
+        )
 
-        return {
-            "month": month,
-            "totalWorkingMinutes": aggregates["total_minutes"],
-            "overtimeMinutes": aggregates["overtime_minutes"],
-            "presentDays": present_days,
-            "paidHolidays": paid_holidays,
-            "payableDays": payable_days,
-            "absentDays": absent_days,
+    def _parse_month(self, month: str) -> date:
+        try:
+            year, month_num = map(int, month.split("-"))
+            return date(year, month_num, 1)
+        except ValueError:
+            raise HTTPException(400, "Invalid month, expected YYYY-MM")
+
+    async def get_monthly_summary_range(
+        self,
+        user_id: int,
+        start_month: str,
+        end_month: str | None = None,
+    ) -> list[dict]:
+        """
+        Monthly summaries from start_month to end_month (default: the
+        current month), oldest first. Same numbers as get_monthly_summary,
+        from one grouped query and one holiday lookup for the whole range.
+        """
+        first = self._parse_month(start_month)
+        last = self._parse_month(end_month) if end_month else date.today().replace(day=1)
+
+        if last < first:
+            raise HTTPException(400, "end must not be before start")
+
+        if last > date.today():
+            raise HTTPException(400, "end must not be in the future")
+
+        months = []
+        month = first
+        while month <= last:
+            months.append(f"{month:%Y-%m}")
+            month = (month + timedelta(days=32)).replace(day=1)
+
+        if len(months) > MAX_SUMMARY_MONTHS:
+            raise HTTPException(400, f"At most {MAX_SUMMARY_MONTHS} months per request")
+
+        *_, range_effective_end, _ = self._month_window(months[-1])
+
+        paid_holiday_dates = await self.attendance_repo.get_paid_holiday_dates(
+            first, range_effective_end
+        )
+        rows = {
+            row.month: row
+            for row in await self.attendance_repo.get_monthly_breakdown(
+                user_id, first, range_effective_end, paid_holiday_dates
+            )
         }
+
+        summaries = []
+        for month in months:
+            start, _, effective_end, effective_days = self._month_window(month)
+            paid_holidays = sum(
+                1 for day in paid_holiday_dates if start <= day < effective_end
+            )
+            row = rows.get(start)
+
+            present_days = row.present_days if row else 0
+            present_on_holidays = row.present_on_holidays if row else 0
+
+            summaries.append(self._build_summary(
+                month,
+                row.total_minutes if row else 0,
+                row.overtime_minutes if row else 0,
+                present_days=present_days,
+                paid_holidays=paid_holidays,
+                payable_days=present_days + paid_holidays - present_on_holidays,
+                effective_days=effective_days,
+            ))
+
+        return summaries
+
+    async def get_monthly_summaries(self, month: str) -> dict[int, dict]:
+        """Monthly summary for every user at once, keyed by user id."""
+        start, end, effective_end, effective_days = self._month_window(month)
+
+        paid_holiday_dates = await self.attendance_repo.get_paid_holiday_dates(
+            start, effective_end
+        )
+
+        paid_holidays = len(paid_holiday_dates)
+        summaries = {}
+
+        # Closed months are served from the rollup table
+        if end <= date.today():
+            rollups = await self.attendance_repo.get_monthly_rollups(start)
+
+            if rollups:
+                present_on_holidays = await self.attendance_repo.get_present_on_holidays(
+                    start, end, paid_holiday_dates
+                )
+
+                for rollup in rollups:
+                    summary = self._build_summary(
+                        month,
+                        rollup.total_minutes,
+                        rollup.overtime_minutes,
+                        present_days=rollup.present_days,
+                        paid_holidays=paid_holidays,
+                        payable_days=(
+                            rollup.present_days
+                            + paid_holidays
+                            - present_on_holidays.get(rollup.user_id, 0)
+                        ),
+                        effective_days=effective_days,
+                    )
+                    summary["missingClockOutCount"] = rollup.missing_clock_outs
+                    summaries[rollup.user_id] = summary
+
+                return summaries
+
+        rows = await self.attendance_repo.get_payroll_aggregates(
+            start, effective_end, end, paid_holiday_dates
+        )
+
+        for row in rows:
+            summary = self._build_summary(
+                month,
+                row.total_minutes,
+                row.overtime_minutes,
+                present_days=row.present_days,
+                paid_holidays=paid_holidays,
+                payable_days=(
+                    row.present_days + paid_holidays - row.present_on_holidays
+                ),
+                effective_days=effective_days,
+            )
+            summary["missingClockOutCount"] = row.missing_clock_outs
+            summaries[row.user_id] = summary
+
+        return summaries
     
     async def get_missing_clock_out_count(self, user_id: int, start: date, end: date):
         return await self.attendance_repo.get_missing_clock_out_count(user_id, start, end)
@@ -250,12 +480,26 @@ class AttendanceService:
     async def get_available_months_all_users(self) -> list[str]:
         return await self.attendance_repo.get_available_months_all_users()
     
-    async def export_attendance_excel(self, start_date, end_date):
-        rows = await self.attendance_repo.fetch_attendance_range(
+    async def export_attendance(
+        self,
+        start_date,
+        end_date,
+        fmt: ExportFormat = ExportFormat.XLSX,
+    ):
+        if fmt == ExportFormat.CSV:
+            write = write_attendance_csv
+        elif fmt == ExportFormat.PARQUET:
+            write = write_attendance_parquet
+        else:
+            users = await self.attendance_repo.get_attendance_range_users(
+                start_date=start_date,
+                end_date=end_date,
+            )
+            write = partial(write_attendance_excel, users=users)
+
+        rows = self.attendance_repo.fetch_attendance_range(
             start_date=start_date,
             end_date=end_date,
         )
 
-        grouped = self._group_by_user(rows)
-
-        return create_attendance_excel(grouped)
+        return stream_from_thread(write, rows)
@@ -6,7 +6,9 @@ from sqlalchemy import (
     String,
     Text,
     DateTime,
-    Enum as SAEnum
+    Index,
+    Enum as SAEnum,
+    text
 )
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 from sqlalchemy.sql import func
@@ -17,6 +19,15 @@ from app.core.enums import AttendanceRequestType, AttendanceRequestStatus
 
 class AttendanceRequest(BaseModel):
     __tablename__ = "attendance_requests"
+    __table_args__ = (
+        # admin review queue, oldest first
+        Index(
+            "ix_attendance_requests_pending",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
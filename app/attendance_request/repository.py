@@ -1,26 +1,18 @@
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, update, or_, and_, cast, func, tuple_, literal_column, Date
+from sqlalchemy.orm import joinedload
 
+from app.attendance.models import Attendance
 from app.attendance_request.models import AttendanceRequest
 from app.core.enums import AttendanceRequestType, AttendanceRequestStatus
+from app.core.repository import BaseRepository
 
 IST = ZoneInfo("Asia/Kolkata")
 
 
-class AttendanceRequestRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
-
-    async def create(self, request: AttendanceRequest):
-        self.session.add(request)
-        await self.session.commit()
-        await self.session.refresh(request)
-        return request
-
+class AttendanceRequestRepository(BaseRepository):
     async def get_my_requests(self, user_id: int):
         stmt = (
             select(AttendanceRequest)
@@ -30,15 +22,50 @@ class AttendanceRequestRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def get_pending_requests(self):
+    def _pending(
+        self,
+        request_type: AttendanceRequestType | None = None,
+        user_id: int | None = None,
+    ):
+        # Inline literal so even generic prepared plans can match the
+        # partial index ix_attendance_requests_pending
+        stmt = select(AttendanceRequest).where(
+            AttendanceRequest.status == literal_column("'PENDING'")
+        )
+
+        if request_type:
+            stmt = stmt.where(AttendanceRequest.request_type == request_type)
+
+        if user_id:
+            stmt = stmt.where(AttendanceRequest.user_id == user_id)
+
+        return stmt.order_by(
+            AttendanceRequest.created_at.asc(),
+            AttendanceRequest.id.asc(),
+        )
+
+    async def get_pending_requests(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        request_type: AttendanceRequestType | None = None,
+        user_id: int | None = None,
+    ) -> list[AttendanceRequest]:
+        """Oldest pending first, keyset paginated on (created_at, id)."""
         stmt = (
-            select(AttendanceRequest)
-            .where(AttendanceRequest.status == "PENDING")
-            .options(selectinload(AttendanceRequest.user))
+            self._pending(request_type, user_id)
+            .options(joinedload(AttendanceRequest.user))
+            .limit(limit)
         )
+
+        if after:
+            stmt = stmt.where(
+                tuple_(AttendanceRequest.created_at, AttendanceRequest.id)
+                > tuple_(*after)
+            )
+
         result = await self.session.execute(stmt)
         return result.scalars().all()
-    
 
     async def get_by_id(self, request_id: int) -> AttendanceRequest:
         stmt = select(AttendanceRequest).where(
@@ -46,9 +73,57 @@ class AttendanceRequestRepository:
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
-    
-    async def update(self, request: AttendanceRequest) -> AttendanceRequest:
-        await self.session.commit()
-        await self.session.refresh(request)
 
-        return request
\ No newline at end of file
+    async def get_for_review(
+        self,
+        request_ids: list[int],
+    ) -> list[tuple[AttendanceRequest, Attendance | None]]:
+        """
+        Requests with the attendance row they affect, locked for review.
+        Requests without attendance_id are matched to the user's row for
+        the requested IST day, if one already exists.
+        """
+        requested_day = cast(
+            func.timezone("Asia/Kolkata", AttendanceRequest.requested_time),
+            Date,
+        )
+
+        stmt = (
+            select(AttendanceRequest, Attendance)
+            .outerjoin(
+                Attendance,
+                or_(
+                    Attendance.id == AttendanceRequest.attendance_id,
+                    and_(
+                        AttendanceRequest.attendance_id.is_(None),
+                        Attendance.user_id == AttendanceRequest.user_id,
+                        Attendance.attendance_date == requested_day,
+                    ),
+                ),
+            )
+            .where(AttendanceRequest.id.in_(request_ids))
+            .order_by(AttendanceRequest.id)
+            .with_for_update(of=AttendanceRequest)
+        )
+
+        result = await self.session.execute(stmt)
+        return result.tuples().all()
+
+    async def bulk_update(self, values: list[dict]) -> None:
+        """UPDATE by primary key, one executemany for all rows."""
+        if values:
+            await self.session.execute(update(AttendanceRequest), values)
+
+    async def bulk_insert(self, values: list[dict]) -> None:
+        """Multi-row INSERT, one executemany for all rows."""
+        if values:
+            await self.session.execute(insert(AttendanceRequest), values)
+
+    async def get_pending_attendance_ids(self, attendance_ids: list[int]) -> set[int]:
+        stmt = select(AttendanceRequest.attendance_id).where(
+            AttendanceRequest.status == literal_column("'PENDING'"),
+            AttendanceRequest.attendance_id.in_(attendance_ids),
+        )
+
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
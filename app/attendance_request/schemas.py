@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Literal
 from pydantic import BaseModel, computed_field, Field
 
 from app.core.enums import AttendanceRequestType, AttendanceRequestStatus
@@ -38,4 +38,27 @@ class AttendanceRequestAdminResponse(BaseModel):
     reviewed_at: Optional[datetime]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class AttendanceRequestAdminPage(BaseModel):
+    items: list[AttendanceRequestAdminResponse]
+    next_cursor: Optional[str]
+
+
+class AttendanceRequestBulkReviewSchema(BaseModel):
+    request_ids: list[int] = Field(min_length=1, max_length=500)
+    action: Literal["approve", "reject"]
+
+
+class AttendanceRequestReviewResult(BaseModel):
+    request_id: int
+    status: Optional[AttendanceRequestStatus] = None
+    attendance_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class AttendanceRequestBulkReviewResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[AttendanceRequestReviewResult]
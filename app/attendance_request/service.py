@@ -5,10 +5,15 @@ from fastapi import HTTPException, status
 
 from app.attendance.models import Attendance
 from app.attendance_request.schemas import AttendanceRequestCreateSchema, AttendanceRequestResponseSchema, AttendanceRequestAdminResponse
+from app.attendance_request.schemas import AttendanceRequestReviewResult, AttendanceRequestBulkReviewResponse
+from app.attendance_request.schemas import AttendanceRequestAdminPage
 from app.attendance.repository import AttendanceRepository
+from app.attendance.cache import invalidate_attendance
+from app.admin.dashboard import dashboard_live
 from app.attendance_request.models import AttendanceRequest
 from app.attendance_request.repository import AttendanceRequestRepository
 from app.utils.date_utils import to_utc
+from app.utils.cursor import encode_cursor, decode_cursor
 from app.core.enums import AttendanceRequestType, AttendanceRequestStatus
 
 STANDARD_WORK_MINUTES = (8 * 60) + 30
@@ -46,6 +51,8 @@ class AttendanceRequestService:
 
         req = AttendanceRequest(**request_data)
         req = await self.request_repo.create(req)
+        await self.request_repo.commit()
+        await dashboard_live.requests_changed()
 
         return AttendanceRequestResponseSchema.model_validate(req)
 
@@ -73,6 +80,14 @@ class AttendanceRequestService:
 
         if request.request_type == AttendanceRequestType.FORGOT_CLOCK_IN:
 
+            # Same matching as get_for_review: the user's row for the
+            # requested IST day, one per day under the unique index
+            if not attendance:
+                attendance = await self.attendance_repo.get_today_attendance(
+                    request.user_id,
+                    request.requested_time.astimezone(IST).date(),
+                )
+
             if attendance:
                 attendance.clock_in = request.requested_time
             else:
@@ -106,6 +121,7 @@ class AttendanceRequestService:
                 )
 
             attendance.clock_out = request.requested_time
+            attendance.missing_clock_out = False
             attendance.total_minutes = int(
                 (attendance.clock_out - attendance.clock_in).total_seconds() // 60
             )
@@ -119,11 +135,19 @@ class AttendanceRequestService:
         else:
             raise HTTPException(400, "Unsupported request type")
 
+        await self.attendance_repo.refresh_monthly_rollup(
+            attendance.user_id, attendance.attendance_date
+        )
+
         request.status = AttendanceRequestStatus.APPROVED
         request.reviewed_by = admin_id
         request.reviewed_at = datetime.now(timezone.utc)
 
         await self.request_repo.update(request)
+        await self.request_repo.commit()
+        await invalidate_attendance(attendance.user_id, attendance.attendance_date)
+        await dashboard_live.attendance_changed(attendance)
+        await dashboard_live.requests_changed()
 
         return request
 
@@ -145,8 +169,185 @@ class AttendanceRequestService:
         request.reviewed_at = datetime.now(timezone.utc)
 
         await self.request_repo.update(request)
+        await self.request_repo.commit()
+        await dashboard_live.requests_changed()
 
         return request
+
+    async def review_requests(
+        self,
+        request_ids: list[int],
+        approve: bool,
+        admin_id: int,
+    ) -> AttendanceRequestBulkReviewResponse:
+        request_ids = list(dict.fromkeys(request_ids))
+        rows = {
+            request.id: (request, attendance)
+            for request, attendance
+            in await self.request_repo.get_for_review(request_ids)
+        }
+
+        new_status = (
+            AttendanceRequestStatus.APPROVED if approve
+            else AttendanceRequestStatus.REJECTED
+        )
+        reviewed_at = datetime.now(timezone.utc)
+
+        # Attendance values as of the end of this batch, so several
+        # requests for the same day stack like sequential approvals
+        updated: dict[int, dict] = {}
+        created: dict[tuple[int, date], dict] = {}
+        touched: set[tuple[int, date]] = set()
+
+        request_values = []
+        results = []
+        links = []
+
+        for request_id in request_ids:
+            request, attendance = rows.get(request_id, (None, None))
+
+            try:
+                if not request:
+                    raise HTTPException(404, "Request not found")
+
+                if request.status != AttendanceRequestStatus.PENDING:
+                    raise HTTPException(400, "Request already processed")
+
+                values = {
+                    "id": request.id,
+                    "status": new_status,
+                    "reviewed_by": admin_id,
+                    "reviewed_at": reviewed_at,
+                }
+                result = AttendanceRequestReviewResult(
+                    request_id=request_id,
+                    status=new_status,
+                    attendance_id=request.attendance_id,
+                )
+
+                if approve:
+                    attendance_values, key = self._approve_values(
+                        request, attendance, updated, created
+                    )
+                    touched.add(key)
+                    links.append((values, result, attendance_values))
+
+            except HTTPException as exc:
+                results.append(
+                    AttendanceRequestReviewResult(
+                        request_id=request_id,
+                        error=exc.detail,
+                    )
+                )
+                continue
+
+            request_values.append(values)
+            results.append(result)
+
+        # -------- WRITE (one transaction) --------
+        await self.attendance_repo.bulk_update(list(updated.values()))
+
+        new_rows = list(created.values())
+        for attendance_values, attendance_id in zip(
+            new_rows, await self.attendance_repo.bulk_insert(new_rows)
+        ):
+            attendance_values["id"] = attendance_id
+
+        for values, result, attendance_values in links:
+            values["attendance_id"] = attendance_values["id"]
+            result.attendance_id = attendance_values["id"]
+
+        await self.request_repo.bulk_update(request_values)
+
+        months = {(user_id, day.replace(day=1)) for user_id, day in touched}
+        for user_id, month_start in months:
+            await self.attendance_repo.refresh_monthly_rollup(user_id, month_start)
+
+        await self.request_repo.commit()
+
+        for user_id, day in touched:
+            await invalidate_attendance(user_id, day)
+
+        if approve:
+            await dashboard_live.board_changed()
+        else:
+            await dashboard_live.requests_changed()
+
+        return AttendanceRequestBulkReviewResponse(
+            succeeded=len(request_values),
+            failed=len(results) - len(request_values),
+            results=results,
+        )
+
+    def _approve_values(
+        self,
+        request: AttendanceRequest,
+        attendance: Attendance | None,
+        updated: dict[int, dict],
+        created: dict[tuple[int, date], dict],
+    ) -> tuple[dict, tuple[int, date]]:
+        """Apply an approval to the batch state, same rules as approve_request."""
+        if not request.requested_time:
+            raise HTTPException(400, "Requested time missing")
+
+        if attendance:
+            key = (attendance.user_id, attendance.attendance_date)
+            values = updated.get(attendance.id) or {
+                "id": attendance.id,
+                "clock_in": attendance.clock_in,
+                "clock_out": attendance.clock_out,
+                "total_minutes": attendance.total_minutes,
+                "overtime_minutes": attendance.overtime_minutes,
+                "missing_clock_out": attendance.missing_clock_out,
+            }
+        else:
+            key = (request.user_id, request.requested_time.astimezone(IST).date())
+            values = created.get(key)
+
+        if request.request_type == AttendanceRequestType.FORGOT_CLOCK_IN:
+
+            if values is None:
+                values = {
+                    "user_id": key[0],
+                    "attendance_date": key[1],
+                    "clock_out": None,
+                    "total_minutes": None,
+                    "overtime_minutes": 0,
+                    "missing_clock_out": False,
+                }
+
+            values["clock_in"] = request.requested_time
+
+        elif request.request_type == AttendanceRequestType.FORGOT_CLOCK_OUT:
+
+            if not values or not values.get("clock_in"):
+                raise HTTPException(
+                    400, "Cannot approve clock-out without clock-in"
+                )
+
+            values["clock_out"] = request.requested_time
+            values["missing_clock_out"] = False
+
+        else:
+            raise HTTPException(400, "Unsupported request type")
+
+        # If clock-out exists, recompute totals
+        if values["clock_out"]:
+            values["total_minutes"] = int(
+                (values["clock_out"] - values["clock_in"]).total_seconds() // 60
+            )
+            values["overtime_minutes"] = max(
+                0, values["total_minutes"] - STANDARD_WORK_MINUTES
+            )
+
+        values["is_manual"] = True
+
+        if attendance:
+            updated[attendance.id] = values
+        else:
+            created[key] = values
+
+        return values, key
     
     async def get_request_by_user_id(self, user_id: int) -> list[AttendanceRequestResponseSchema]:
         requests = await self.request_repo.get_my_requests(user_id)
@@ -156,11 +357,34 @@ class AttendanceRequestService:
             for req in requests
         ]
 
-    async def get_pending_requests(self) -> list[AttendanceRequestAdminResponse]:
-        requests = await self.request_repo.get_pending_requests()
-
-        return [
-            AttendanceRequestAdminResponse.model_validate(req)
-            for req in requests
-        ]
+    async def get_pending_requests(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        request_type: AttendanceRequestType | None = None,
+        user_id: int | None = None,
+    ) -> AttendanceRequestAdminPage:
+        after = None
+        if cursor:
+            after = decode_cursor(cursor, datetime.fromisoformat, int)
+
+        requests = await self.request_repo.get_pending_requests(
+            limit=limit,
+            after=after,
+            request_type=request_type,
+            user_id=user_id,
+        )
+
+        next_cursor = None
+        if len(requests) == limit:
+            last = requests[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return AttendanceRequestAdminPage(
+            items=[
+                AttendanceRequestAdminResponse.model_validate(req)
+                for req in requests
+            ],
+            next_cursor=next_cursor,
+        )
 
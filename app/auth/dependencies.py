@@ -7,8 +7,8 @@ from app.auth.security import OAuth2PasswordBearerWithCookie
 from app.auth.service import Service
 from app.auth.repository import Repository
 from app.users.repository import UserRepository
-from app.auth.tokens import TokenManager
-from app.core.config import settings
+from app.auth.tokens import token_manager
+from app.users.cache import user_cache
 from app.core.database import get_session
 
 
@@ -37,13 +37,6 @@ async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     session: AsyncSession = Depends(get_session),
 ):
-    token_manager = TokenManager(
-                        settings.JWT_SECRET_KEY, 
-                        settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-                        settings.REFRESH_TOKEN_EXPIRE_MINUTES,
-                        settings.ALGORITHM
-                    )
-
     payload = token_manager.verify(token, expected="access")
     user_id = payload.get("sub")
 
@@ -53,13 +46,24 @@ async def get_current_user(
             detail="Invalid authentication token",
         )
 
-    repo = UserRepository(session)
-    user = await repo.get_by_id(int(user_id))
+    user_id = int(user_id)
+    user = user_cache.get(user_id)
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
+    if user is None:
+        repo = UserRepository(session)
+        user = await repo.get_by_id(user_id)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+
+        session.expunge(user)
+        user_cache.set(user_id, user)
+
+        # Hand the connection back now, the session is only closed after
+        # the response is sent, which for a stream can take hours
+        await session.close()
 
-    return user
\ No newline at end of file
+    return user
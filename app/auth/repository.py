@@ -2,15 +2,12 @@ import hashlib
 from datetime import datetime
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.models import RefreshToken
+from app.core.repository import BaseRepository
 
 
-class Repository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
-
+class Repository(BaseRepository):
     def _hash(self, token: str) -> str:
         return hashlib.sha256(token.encode()).hexdigest()
 
@@ -41,7 +38,7 @@ class Repository:
                 )
             )
 
-        await self.session.commit()
+        await self.session.flush()
 
     async def validate(self, refresh_token: str) -> RefreshToken | None:
         token_hash = self._hash(refresh_token)
@@ -56,4 +53,4 @@ class Repository:
         token = await self.get_by_user(user_id)
         if token:
             token.revoked = True
-            await self.session.commit()
\ No newline at end of file
+            await self.session.flush()
\ No newline at end of file
@@ -4,9 +4,8 @@ from datetime import datetime, timezone
 from fastapi import HTTPException
 
 from app.auth.repository import Repository
-from app.auth.tokens import TokenManager
-from app.core.config import settings
-from app.core.password import verify_password
+from app.auth.tokens import token_manager
+from app.core.password import password_hasher
 from app.users.repository import UserRepository
 
 
@@ -14,16 +13,11 @@ class Service:
     def __init__(self, repo: Repository, user_repo: UserRepository):
         self.repo = repo
         self.user_repo = user_repo
-        self.tokens = TokenManager(
-            settings.JWT_SECRET_KEY, 
-            settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-            settings.REFRESH_TOKEN_EXPIRE_MINUTES,
-            settings.ALGORITHM
-        )
+        self.tokens = token_manager
 
     async def authenticate(self, email: str, password: str) -> Optional[Tuple[int, str]]:
         user = await self.user_repo.get_by_email(email)
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await password_hasher.verify(password, user.password_hash):
             return None
         return user.id, user.role
 
@@ -38,6 +32,7 @@ class Service:
         )
 
         await self.repo.upsert(user_id, refresh, expires_at)
+        await self.repo.commit()
 
         return access, refresh
 
@@ -57,4 +52,5 @@ class Service:
         return await self.issue_tokens(user_id, user.role)
 
     async def logout(self, user_id: int):
-        await self.repo.revoke(user_id)
\ No newline at end of file
+        await self.repo.revoke(user_id)
+        await self.repo.commit()
\ No newline at end of file
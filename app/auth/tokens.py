@@ -1,9 +1,14 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 import jwt
 from jwt.exceptions import InvalidTokenError
 
 from fastapi import HTTPException, status
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+
 
 class TokenManager:
     def __init__(
@@ -12,12 +17,16 @@ class TokenManager:
         access_minutes: int,
         refresh_minutes: int,
         algorithm: str,
+        cache_size: int = 10000,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_minutes = access_minutes
         self.refresh_minutes = refresh_minutes
 
+        # Verified payloads by token hash, each kept until its own exp
+        self.cache = TTLCache(maxsize=cache_size, ttl=access_minutes * 60)
+
     def _access_payload(self, sub: int, role: str, expires: timedelta):
         now = datetime.now(timezone.utc)
         return {
@@ -59,10 +68,29 @@ class TokenManager:
         )  
 
     def verify(self, token: str, expected: str):
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            if payload.get("token_type") != expected:
-                raise HTTPException(status_code=401, detail="Invalid token type")
-            return payload
-        except InvalidTokenError:
-            raise HTTPException(status_code=401, detail="Invalid token")
\ No newline at end of file
+        # Only access tokens are verified on every request; long-lived
+        # refresh tokens would just push them out of the cache
+        key = hashlib.sha256(token.encode()).digest()
+        payload = self.cache.get(key) if expected == "access" else None
+
+        if payload is None:
+            try:
+                payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            except InvalidTokenError:
+                raise HTTPException(status_code=401, detail="Invalid token")
+
+            ttl = payload.get("exp", 0) - time.time()
+            if ttl > 0 and payload.get("token_type") == "access":
+                self.cache.set(key, payload, ttl=ttl)
+
+        if payload.get("token_type") != expected:
+            raise HTTPException(status_code=401, detail="Invalid token type")
+        return payload
+
+token_manager = TokenManager(
+    settings.JWT_SECRET_KEY,
+    settings.ACCESS_TOKEN_EXPIRE_MINUTES,
+    settings.REFRESH_TOKEN_EXPIRE_MINUTES,
+    settings.ALGORITHM,
+    cache_size=settings.TOKEN_CACHE_SIZE
+)
@@ -1,3 +1,6 @@
+from datetime import time
+from typing import Literal
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
@@ -10,6 +13,48 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ENV: str
 
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_RECYCLE: int = -1
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    EXPORT_DIR: str = "exports"
+    EXPORT_WORKERS: int = 2
+    EXPORT_TTL_MINUTES: int = 60
+
+    # /attendances/my page size when the client does not ask for one
+    ATTENDANCE_PAGE_SIZE: int = 31
+
+    # days per multi-row upsert when importing punch logs
+    ATTENDANCE_IMPORT_BATCH_SIZE: int = 1000
+    # older punches are rejected, a reset terminal clock logs 2000-01-01
+    ATTENDANCE_IMPORT_MAX_AGE_DAYS: int = 366
+
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    TOKEN_CACHE_SIZE: int = 10000
+    HOLIDAY_CACHE_TTL_SECONDS: int = 3600
+
+    # redis://... to share cached responses between workers
+    RESPONSE_CACHE_URL: str | None = None
+    RESPONSE_CACHE_SIZE: int = 4096
+    RESPONSE_CACHE_TTL_SECONDS: int = 86400
+
+    # days left without a clock-out: flag, cap (close at the standard
+    # shift) or request (flag and open a FORGOT_CLOCK_OUT for review).
+    # Always on, payroll counts missing clock-outs from the flag it sets
+    AUTO_CLOSE_POLICY: Literal["flag", "cap", "request"] = "flag"
+    AUTO_CLOSE_TIME: time = time(0, 30)  # IST
+    AUTO_CLOSE_BATCH_SIZE: int = 500
+
+    DASHBOARD_STREAM_QUEUE_SIZE: int = 100
+    DASHBOARD_STREAM_KEEPALIVE_SECONDS: float = 15
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 256
+
     @property
     def is_production(self) -> bool:
         return self.ENV == "production"
@@ -16,4 +16,13 @@ class AttendanceRequestStatus(str, Enum):
 
 class UserRole(str, Enum):
     USER = "user"
-    ADMIN = "admin"
\ No newline at end of file
+    ADMIN = "admin"
+
+class ExportFormat(str, Enum):
+    XLSX = "xlsx"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
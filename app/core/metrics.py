@@ -0,0 +1,145 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route",
+    ["method", "route", "status"],
+)
+
+REQUEST_SQL_STATEMENTS = Histogram(
+    "http_request_sql_statements",
+    "SQL statements executed per request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233),
+)
+
+REQUEST_SQL_DURATION = Histogram(
+    "http_request_sql_duration_seconds",
+    "Total SQL time per request",
+    ["method", "route"],
+)
+
+
+class RequestStats:
+    __slots__ = ("statements", "sql_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+@contextmanager
+def track_requests() -> Iterator[RequestStats]:
+    """
+    Collect SQL stats for requests served from the current context, e.g.
+    an in-process ASGI call made by the benchmark harness.
+    """
+    stats = RequestStats()
+    token = _request_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count statements and SQL time against the current request."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # On the per-statement context: a failed statement never reaches
+        # after_cursor_execute, so nothing may be left on the connection
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.sql_seconds += elapsed
+
+
+class MetricsMiddleware:
+    """Records latency, SQL statement count and SQL time per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reuse the caller's stats when one is tracking (track_requests)
+        stats = _request_stats.get() or RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = route.path if route else "unmatched"
+            method = scope["method"]
+
+            REQUEST_LATENCY.labels(method, path, str(status_code)).observe(
+                time.perf_counter() - started
+            )
+            REQUEST_SQL_STATEMENTS.labels(method, path).observe(stats.statements)
+            REQUEST_SQL_DURATION.labels(method, path).observe(stats.sql_seconds)
+
+            _request_stats.reset(token)
+
+
+class StatsCollector:
+    """Exposes the in-process stats() dicts (pool, caches, ...) as gauges."""
+
+    def __init__(self):
+        self.sources: dict[str, Callable[[], dict]] = {}
+
+    def collect(self):
+        for name, source in self.sources.items():
+            for key, value in source().items():
+                if isinstance(value, (int, float)):
+                    yield GaugeMetricFamily(f"app_{name}_{key}", f"{name} {key}", value=value)
+
+
+stats_collector = StatsCollector()
+REGISTRY.register(stats_collector)
+
+
+def register_stats(name: str, source: Callable[[], dict]) -> None:
+    stats_collector.sources[name] = source
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -4,4 +4,7 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class BaseModel(DeclarativeBase, AsyncAttrs):
+    # fetch server defaults with RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
\ No newline at end of file
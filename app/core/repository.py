@@ -0,0 +1,24 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class BaseRepository:
+    """
+    Writes are flushed, not committed. Server-generated columns come back
+    through INSERT/UPDATE ... RETURNING (eager_defaults on BaseModel), so
+    no refresh is needed. Services commit once when their work is done.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, instance):
+        self.session.add(instance)
+        await self.session.flush()
+        return instance
+
+    async def update(self, instance):
+        await self.session.flush()
+        return instance
+
+    async def commit(self) -> None:
+        await self.session.commit()
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass, asdict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.responses import dumps
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    last_modified: str
+    modified_at: float
+
+    @classmethod
+    def build(cls, content: Any, modified_at: float) -> "CachedResponse":
+        body = dumps(content)
+
+        return cls(
+            body=body,
+            etag='"%s"' % hashlib.sha1(body).hexdigest(),
+            last_modified=formatdate(modified_at, usegmt=True),
+            modified_at=modified_at,
+        )
+
+    def dumps(self) -> bytes:
+        data = asdict(self)
+        data["body"] = self.body.decode("utf-8")
+        return json.dumps(data).encode("utf-8")
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "CachedResponse":
+        data = json.loads(raw)
+        data["body"] = data["body"].encode("utf-8")
+        return cls(**data)
+
+
+class MemoryBackend:
+    """Per-process LRU, the default backend."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return self.cache.get(key)
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        self.cache.set(key, entry)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.cache.pop(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [k for k in self.cache.keys() if k.startswith(prefix)]:
+            self.cache.pop(key)
+
+    async def close(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self.cache.stats()}
+
+
+class RedisBackend:
+    """Shared backend for multi-worker deployments (redis.asyncio)."""
+
+    def __init__(self, url: str, ttl: int, namespace: str = "response-cache:"):
+        try:
+            from redis import asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "RESPONSE_CACHE_URL is set but the 'redis' package is not installed"
+            ) from exc
+
+        self.client = redis.from_url(url)
+        self.ttl = ttl
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> CachedResponse | None:
+        raw = await self.client.get(self.namespace + key)
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return CachedResponse.loads(raw)
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        await self.client.set(self.namespace + key, entry.dumps(), ex=self.ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.namespace + key for key in keys))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        keys = [
+            key async for key in self.client.scan_iter(
+                match=self.namespace + prefix + "*", count=500
+            )
+        ]
+        if keys:
+            await self.client.delete(*keys)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+
+class ResponseCache:
+    """
+    Caches rendered JSON bodies and answers conditional GETs.
+
+    Keys are built by the owning domain (see app/attendance/cache.py),
+    which is also responsible for deleting them after writes.
+    """
+
+    def __init__(self):
+        self.backend = None
+
+    def start(self) -> None:
+        if settings.RESPONSE_CACHE_URL:
+            self.backend = RedisBackend(
+                settings.RESPONSE_CACHE_URL,
+                ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+            )
+        else:
+            self.backend = MemoryBackend(
+                maxsize=settings.RESPONSE_CACHE_SIZE,
+                ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+            )
+
+    async def shutdown(self) -> None:
+        if self.backend:
+            await self.backend.close()
+            self.backend = None
+
+    async def respond(
+        self,
+        request: Request,
+        key: str | None,
+        produce: Callable[[], Awaitable[Any]],
+    ) -> Response:
+        """
+        Serve `key` from the cache, or render `produce()` and store it.
+        Pass key=None for responses that must not be cached; they still
+        get an ETag but no Last-Modified, since they can change silently.
+        """
+        entry = None
+        if key and self.backend:
+            entry = await self.backend.get(key)
+
+        if entry is None:
+            now = time.time()
+            entry = CachedResponse.build(await produce(), now)
+
+            if key and self.backend:
+                await self.backend.set(key, entry)
+
+        headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+        if key:
+            headers["Last-Modified"] = entry.last_modified
+
+        if _not_modified(request, entry, check_date=bool(key)):
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=entry.body,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if self.backend:
+            await self.backend.delete(*keys)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        if self.backend:
+            await self.backend.delete_prefix(prefix)
+
+    def stats(self) -> dict:
+        return self.backend.stats() if self.backend else {}
+
+
+def _not_modified(request: Request, entry: CachedResponse, check_date: bool) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+
+    # If-None-Match wins over If-Modified-Since (RFC 9110 13.1.3)
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or entry.etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if check_date and if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+        # HTTP dates have one-second resolution
+        return int(entry.modified_at) <= since
+
+    return False
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,44 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # Same output as fastapi.encoders.jsonable_encoder for the types
+    # orjson doesn't know; date, datetime, enums and dicts are native
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+
+    if hasattr(obj, "_sa_instance_state"):
+        return {
+            key: value
+            for key, value in vars(obj).items()
+            if not key.startswith("_sa")
+        }
+
+    if hasattr(obj, "keys"):
+        return dict(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson-backed JSON response, the app's default response class.
+
+    Routes that return it directly skip jsonable_encoder entirely; Decimal,
+    ORM rows and mappings are handled by the encoder hook above.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,36 @@
+import pickle
+from functools import partial
+from typing import Iterator
+
+from app.core.enums import ExportFormat
+from app.utils.excel import write_attendance_excel
+from app.utils.export import write_attendance_csv, write_attendance_parquet
+
+
+def _read_spool(spool_path: str) -> Iterator:
+    with open(spool_path, "rb") as spool:
+        while True:
+            try:
+                chunk = pickle.load(spool)
+            except EOFError:
+                return
+
+            yield from chunk
+
+
+def render_export(
+    spool_path: str,
+    artifact_path: str,
+    fmt: ExportFormat,
+    users: list,
+) -> None:
+    """Build the export file from spooled rows. Runs in a worker process."""
+    if fmt == ExportFormat.CSV:
+        write = write_attendance_csv
+    elif fmt == ExportFormat.PARQUET:
+        write = write_attendance_parquet
+    else:
+        write = partial(write_attendance_excel, users=users)
+
+    with open(artifact_path, "wb") as artifact:
+        write(artifact, _read_spool(spool_path))
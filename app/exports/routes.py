@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.core.dependencies import require_admin
+from app.exports.schemas import ExportJobCreate, ExportJobResponse
+from app.exports.service import export_jobs
+from app.utils.date_utils import resolve_date_range
+from app.utils.export import MEDIA_TYPES
+
+
+router = APIRouter(
+    prefix="/admin/exports",
+    tags=["Admin - Exports"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+def _get_job(job_id: str):
+    job = export_jobs.get(job_id)
+    if not job:
+        raise HTTPException(404, "Export not found")
+    return job
+
+
+@router.post(
+    "",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def create_export(data: ExportJobCreate):
+    start_date, end_date = resolve_date_range(data.start_date, data.end_date)
+    return export_jobs.submit(start_date, end_date, data.format)
+
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+async def get_export(job_id: str):
+    return _get_job(job_id)
+
+
+@router.get("/{job_id}/download")
+async def download_export(job_id: str):
+    job = _get_job(job_id)
+
+    if job.status != "DONE":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Export is not ready"
+        )
+
+    return FileResponse(
+        job.path,
+        media_type=MEDIA_TYPES[job.format],
+        filename=f"attendance_{job.start_date}_{job.end_date}.{job.format.value}",
+    )
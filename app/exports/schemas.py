@@ -0,0 +1,34 @@
+from datetime import date, datetime
+from typing import Optional, Literal
+
+from pydantic import BaseModel
+
+from app.core.enums import ExportFormat
+
+ExportJobStatus = Literal[
+    "PENDING",
+    "RUNNING",
+    "DONE",
+    "FAILED"
+]
+
+
+class ExportJobCreate(BaseModel):
+    start_date: date | None = None
+    end_date: date | None = None
+    format: ExportFormat = ExportFormat.XLSX
+
+
+class ExportJobResponse(BaseModel):
+    id: str
+    status: ExportJobStatus
+    format: ExportFormat
+    start_date: date
+    end_date: date
+    created_at: datetime
+    finished_at: Optional[datetime]
+    expires_at: Optional[datetime]
+    error: Optional[str]
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import re
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.database import DbSession
+from app.core.enums import ExportFormat
+from app.attendance.repository import AttendanceRepository
+from app.exports.render import render_export
+
+PURGE_INTERVAL_SECONDS = 60
+# Only names this manager writes: <job id>.spool and <job id>.<format>
+JOB_FILE = re.compile(
+    r"[0-9a-f]{32}\.(spool|%s)" % "|".join(fmt.value for fmt in ExportFormat)
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class ExportJob:
+    id: str
+    format: ExportFormat
+    start_date: date
+    end_date: date
+    status: str = "PENDING"
+    created_at: datetime = field(default_factory=_utcnow)
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None
+    error: str | None = None
+    path: Path | None = None
+
+    @property
+    def key(self) -> tuple:
+        return self.start_date, self.end_date, self.format
+
+
+class ExportJobManager:
+    """
+    In-process export queue. Rows are spooled to disk from the database,
+    then a process pool renders the file so openpyxl never runs on the
+    event loop. Identical in-flight jobs share one job id and finished
+    artifacts are removed once their TTL has passed, by a periodic purge
+    so idle workers do not keep them on disk.
+
+    Files go to a "jobs" subdirectory of `export_dir`. Workers share it,
+    so files another worker may still own are only swept once they are
+    older than the TTL.
+    """
+
+    def __init__(self, export_dir: str, workers: int, ttl: timedelta):
+        self.export_dir = Path(export_dir) / "jobs"
+        self.workers = workers
+        self.ttl = ttl
+
+        self._jobs: dict[str, ExportJob] = {}
+        self._in_flight: dict[tuple, str] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pool: ProcessPoolExecutor | None = None
+        self._purge_task: asyncio.Task | None = None
+
+    def start(self):
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self.purge_orphans()
+
+        self._semaphore = asyncio.Semaphore(self.workers)
+        self._purge_task = asyncio.create_task(self._purge_loop())
+
+    async def shutdown(self):
+        if self._purge_task:
+            self._purge_task.cancel()
+            await asyncio.gather(self._purge_task, return_exceptions=True)
+            self._purge_task = None
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.purge_expired()
+
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def submit(self, start_date: date, end_date: date, fmt: ExportFormat) -> ExportJob:
+        self.purge_expired()
+
+        job_id = self._in_flight.get((start_date, end_date, fmt))
+        if job_id:
+            return self._jobs[job_id]
+
+        job = ExportJob(
+            id=uuid.uuid4().hex,
+            format=fmt,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        self._jobs[job.id] = job
+        self._in_flight[job.key] = job.id
+
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return job
+
+    def get(self, job_id: str) -> ExportJob | None:
+        self.purge_expired()
+        return self._jobs.get(job_id)
+
+    def purge_expired(self):
+        now = _utcnow()
+
+        for job in list(self._jobs.values()):
+            if job.expires_at and job.expires_at <= now:
+                if job.path:
+                    job.path.unlink(missing_ok=True)
+                del self._jobs[job.id]
+
+    def purge_orphans(self):
+        """
+        Remove expired job files no job of this process tracks, left by a
+        previous run or a worker that died.
+        """
+        cutoff = time.time() - self.ttl.total_seconds()
+
+        try:
+            paths = list(self.export_dir.iterdir())
+        except OSError:
+            return
+
+        for path in paths:
+            if not JOB_FILE.fullmatch(path.name):
+                continue
+
+            try:
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+    async def _purge_loop(self):
+        while True:
+            await asyncio.sleep(PURGE_INTERVAL_SECONDS)
+            self.purge_expired()
+            self.purge_orphans()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def _spool_rows(self, job: ExportJob, spool_path: Path) -> list:
+        async with DbSession() as session:
+            repo = AttendanceRepository(session)
+
+            users = []
+            if job.format == ExportFormat.XLSX:
+                users = [
+                    tuple(row)
+                    for row in await repo.get_attendance_range_users(
+                        job.start_date, job.end_date
+                    )
+                ]
+
+            with open(spool_path, "wb") as spool:
+                async for chunk in repo.fetch_attendance_range(
+                    job.start_date, job.end_date
+                ):
+                    pickle.dump(chunk, spool, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return users
+
+    async def _run(self, job: ExportJob):
+        spool_path = self.export_dir / f"{job.id}.spool"
+        artifact_path = self.export_dir / f"{job.id}.{job.format.value}"
+
+        async with self._semaphore:
+            job.status = "RUNNING"
+
+            try:
+                users = await self._spool_rows(job, spool_path)
+
+                await asyncio.get_running_loop().run_in_executor(
+                    self._get_pool(),
+                    render_export,
+                    str(spool_path),
+                    str(artifact_path),
+                    job.format,
+                    users,
+                )
+            except Exception:
+                # The error can hold SQL or paths, the client only gets a summary
+                logger.exception("Export job %s failed", job.id)
+                artifact_path.unlink(missing_ok=True)
+                job.status = "FAILED"
+                job.error = "Export failed"
+            else:
+                job.status = "DONE"
+                job.path = artifact_path
+            finally:
+                spool_path.unlink(missing_ok=True)
+
+                job.finished_at = _utcnow()
+                job.expires_at = job.finished_at + self.ttl
+                self._in_flight.pop(job.key, None)
+
+
+export_jobs = ExportJobManager(
+    settings.EXPORT_DIR,
+    settings.EXPORT_WORKERS,
+    timedelta(minutes=settings.EXPORT_TTL_MINUTES),
+)
@@ -0,0 +1,61 @@
+from bisect import bisect_left
+from datetime import date, timedelta
+from typing import Awaitable, Callable
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+YearLoader = Callable[[int], Awaitable[list[date]]]
+
+
+class HolidayCalendar:
+    """
+    Active paid-holiday dates per year, kept sorted so range lookups are
+    two bisects. Years are loaded on first use and dropped whenever
+    PaidHolidayService commits a change; the TTL only bounds staleness
+    across worker processes.
+    """
+
+    def __init__(self, ttl: float):
+        self._years = TTLCache(maxsize=64, ttl=ttl)
+        self._generation = 0
+
+    async def between(self, start: date, end: date, load: YearLoader) -> set[date]:
+        """Active holidays in [start, end)."""
+        if end <= start:
+            return set()
+
+        dates = set()
+        for year in range(start.year, (end - timedelta(days=1)).year + 1):
+            days = await self._year(year, load)
+            dates.update(days[bisect_left(days, start):bisect_left(days, end)])
+
+        return dates
+
+    async def _year(self, year: int, load: YearLoader) -> list[date]:
+        days = self._years.get(year)
+        if days is not None:
+            return days
+
+        generation = self._generation
+        days = sorted(await load(year))
+
+        # Don't cache a result that raced with an invalidation
+        if generation == self._generation:
+            self._years.set(year, days)
+
+        return days
+
+    def invalidate(self, year: int | None = None) -> None:
+        self._generation += 1
+
+        if year is None:
+            self._years.clear()
+        else:
+            self._years.pop(year)
+
+    def stats(self) -> dict:
+        return self._years.stats()
+
+
+holiday_calendar = HolidayCalendar(ttl=settings.HOLIDAY_CACHE_TTL_SECONDS)
@@ -1,15 +1,12 @@
 from datetime import date
 
 from sqlalchemy import select, delete
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.repository import BaseRepository
 from .models import PaidHoliday
 
 
-class PaidHolidayRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
-
+class PaidHolidayRepository(BaseRepository):
     async def get_by_year(self, year: int) -> list[PaidHoliday]:
         stmt = select(PaidHoliday).where(PaidHoliday.year == year).order_by(PaidHoliday.date.asc())
         result = await self.session.execute(stmt)
@@ -23,18 +20,6 @@ class PaidHolidayRepository:
     async def get_by_id(self, holiday_id: int) -> PaidHoliday | None:
         return await self.session.get(PaidHoliday, holiday_id)
 
-    async def create(self, holiday: PaidHoliday) -> PaidHoliday:
-        self.session.add(holiday)
-        await self.session.commit()
-        await self.session.refresh(holiday)
-        return holiday
-
-    async def update(self, holiday: PaidHoliday) -> PaidHoliday:
-        await self.session.commit()
-        await self.session.refresh(holiday)
-        return holiday
-
     async def delete(self, holiday_id: int) -> None:
         stmt = delete(PaidHoliday).where(PaidHoliday.id == holiday_id)
-        await self.session.execute(stmt)
-        await self.session.commit()
\ No newline at end of file
+        await self.session.execute(stmt)
\ No newline at end of file
@@ -1,5 +1,7 @@
 from fastapi import HTTPException, status
 
+from app.attendance.cache import invalidate_month
+from app.holidays.calendar import holiday_calendar
 from app.holidays.models import PaidHoliday
 from app.holidays.repository import PaidHolidayRepository
 from app.holidays.schemas import (
@@ -30,7 +32,12 @@ class PaidHolidayService:
             is_active=data.is_active,
         )
 
-        return await self.repo.create(holiday)
+        holiday = await self.repo.create(holiday)
+        await self.repo.commit()
+        holiday_calendar.invalidate(holiday.year)
+        await invalidate_month(holiday.date)
+
+        return holiday
 
     async def update_holiday(self, holiday_id: int, data: PaidHolidayUpdate):
         holiday = await self.repo.get_by_id(holiday_id)
@@ -43,7 +50,12 @@ class PaidHolidayService:
         if data.is_active is not None:
             holiday.is_active = data.is_active
 
-        return await self.repo.update(holiday)
+        holiday = await self.repo.update(holiday)
+        await self.repo.commit()
+        holiday_calendar.invalidate(holiday.year)
+        await invalidate_month(holiday.date)
+
+        return holiday
 
     async def delete_holiday(self, holiday_id: int):
         holiday = await self.repo.get_by_id(holiday_id)
@@ -51,6 +63,9 @@ class PaidHolidayService:
             raise HTTPException(404, "Holiday not found")
 
         await self.repo.delete(holiday_id)
+        await self.repo.commit()
+        holiday_calendar.invalidate(holiday.year)
+        await invalidate_month(holiday.date)
 
     async def toggle_holiday(self, holiday_id: int):
         holiday = await self.repo.get_by_id(holiday_id)
@@ -58,4 +73,9 @@ class PaidHolidayService:
             raise HTTPException(404, "Holiday not found")
 
         holiday.is_active = not holiday.is_active
-        return await self.repo.update(holiday)
\ No newline at end of file
+        holiday = await self.repo.update(holiday)
+        await self.repo.commit()
+        holiday_calendar.invalidate(holiday.year)
+        await invalidate_month(holiday.date)
+
+        return holiday
\ No newline at end of file
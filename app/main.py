@@ -5,26 +5,47 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import init_orm, close_orm
+from app.core.responses import FastJSONResponse
+from app.core.database import init_orm, close_orm, pool_status
+from app.core.metrics import MetricsMiddleware, register_stats, router as metrics_router
+from app.core.password import password_hasher
+from app.auth.tokens import token_manager
+from app.users.cache import user_cache
+from app.holidays.calendar import holiday_calendar
+from app.core.response_cache import response_cache
+from app.admin.dashboard import dashboard_live
+from app.attendance.auto_close import auto_close
 from app.attendance.routes import router as attendance_router
 from app.attendance_request.routes import router as request_router
 from app.holidays.routes import router as holiday_router
 from app.admin.routes import router as admin_router
 from app.users.routes import router as user_router
 from app.auth.routes import router as auth_router
+from app.exports.routes import router as export_router
+from app.exports.service import export_jobs
 
 
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     await init_orm()
     print("db initialized")
+    export_jobs.start()
+    response_cache.start()
+    auto_close.start()
     print("Startup")
 
     yield
+    await auto_close.shutdown()
+    await response_cache.shutdown()
+    await export_jobs.shutdown()
     await close_orm()
     print("Shutdown")
 
 
-app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+app = FastAPI(
+    title=settings.PROJECT_NAME,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 origins = [
     "http://localhost",
@@ -34,6 +55,7 @@ origins = [
     "ionic://localhost",
 ]
 
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -48,6 +70,17 @@ app.include_router(holiday_router)
 app.include_router(admin_router)
 app.include_router(user_router)
 app.include_router(auth_router)
+app.include_router(export_router)
+app.include_router(metrics_router)
+
+register_stats("db_pool", pool_status)
+register_stats("token_cache", token_manager.cache.stats)
+register_stats("user_cache", user_cache.stats)
+register_stats("password_hasher", password_hasher.stats)
+register_stats("holiday_calendar", holiday_calendar.stats)
+register_stats("response_cache", response_cache.stats)
+register_stats("dashboard_stream", dashboard_live.stats)
+register_stats("auto_close", auto_close.stats)
 
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
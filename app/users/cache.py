@@ -0,0 +1,8 @@
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Authenticated principals by user id, detached from any session
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
@@ -2,8 +2,11 @@ from fastapi import HTTPException
 
 from app.users.repository import UserRepository
 from app.users.models import User
+from app.users.cache import user_cache
+from app.attendance.cache import invalidate_user
+from app.admin.dashboard import dashboard_live
 from app.users.schemas import UserCreate, UserUpdate
-from app.core.password import hash_password
+from app.core.password import password_hasher
 
 
 class UserService:
@@ -20,12 +23,16 @@ class UserService:
         user = User(
             name=data.name,
             email=data.email,
-            password_hash=hash_password(data.password),
+            password_hash=await password_hasher.hash(data.password),
             perday_rate=data.perday_rate,
             role="user"
         )
 
-        return await self.repo.create(user)
+        user = await self.repo.create(user)
+        await self.repo.commit()
+        await dashboard_live.board_changed()
+
+        return user
 
     async def update_user(self, user_id: int, data: UserUpdate):
         user = await self.repo.get_by_id(user_id)
@@ -35,11 +42,21 @@ class UserService:
         for field, value in data.dict(exclude_unset=True).items():
             setattr(user, field, value)
 
-        return await self.repo.update(user)
+        user = await self.repo.update(user)
+        await self.repo.commit()
+        user_cache.pop(user_id)
+        await invalidate_user(user_id)
+        await dashboard_live.board_changed()
+
+        return user
 
     async def delete_user(self, user_id: int):
         user = await self.repo.get_by_id(user_id)
         if not user:
             raise HTTPException(404, "User not found")
 
-        await self.repo.delete(user)
\ No newline at end of file
+        await self.repo.delete(user)
+        await self.repo.commit()
+        user_cache.pop(user_id)
+        await invalidate_user(user_id)
+        await dashboard_live.board_changed()
\ No newline at end of file
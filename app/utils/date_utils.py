@@ -14,6 +14,16 @@ def get_month_range(year: int, month: int) -> tuple[date, date]:
 
         return start, end
 
+def is_closed_month(month: str) -> bool:
+    """True for a well-formed YYYY-MM month that has fully ended."""
+    try:
+        year, month_num = map(int, month.split("-"))
+        _, end = get_month_range(year, month_num)
+    except ValueError:
+        return False
+
+    return end <= date.today()
+
 def to_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         raise ValueError("Datetime must be timezone-aware")
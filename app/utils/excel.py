@@ -1,9 +1,18 @@
+from itertools import groupby
+from operator import itemgetter
+from typing import BinaryIO, Iterable
+
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment
-from io import BytesIO
+from openpyxl.utils import get_column_letter
 
 from app.utils.date_utils import utc_to_local_time
 
+HEADERS = ["Date", "In", "Out", "TH", "OT"]
+BLOCK_WIDTH = len(HEADERS) + 1  # 5 cols + 1 gap
+
+
 def minutes_to_hm(minutes: int | None) -> str:
     if minutes is None:
         return "—"
@@ -12,48 +21,68 @@ def minutes_to_hm(minutes: int | None) -> str:
     m = minutes % 60
     return f"{h}h {m}m"
 
-def create_attendance_excel(attendance_by_user: dict):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Attendance"
+def write_attendance_excel(
+    fileobj: BinaryIO,
+    rows: Iterable,
+    users: list,
+):
+    """
+    Write attendance into `fileobj` using a write-only workbook.
+
+    `users` is the ordered list of (id, name) column blocks and `rows` are
+    (attendance_date, user_id, user_name, clock_in, clock_out, total_minutes,
+    overtime_minutes) tuples ordered by date, one sheet row per date.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Attendance")
 
     header_font = Font(bold=True)
     center = Alignment(horizontal="center")
 
-    start_col = 1  # Excel column index
+    def header_cell(value):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = header_font
+        cell.alignment = center
+        return cell
+
+    columns = {}
+    name_row = []
+    header_row = []
+
+    for index, (user_id, name) in enumerate(users):
+        start_col = index * BLOCK_WIDTH
+        columns[user_id] = start_col
 
-    for user in attendance_by_user.values():
         # Merge user name header
-        ws.merge_cells(
-            start_row=1,
-            start_column=start_col,
-            end_row=1,
-            end_column=start_col + 4,
+        ws.merged_cells.add(
+            f"{get_column_letter(start_col + 1)}1:"
+            f"{get_column_letter(start_col + len(HEADERS))}1"
         )
-        cell = ws.cell(row=1, column=start_col, value=user["name"])
-        cell.font = header_font
-        cell.alignment = center
+        name_row += [header_cell(name)] + [None] * (BLOCK_WIDTH - 1)
+        header_row += [header_cell(h) for h in HEADERS] + [None]
+
+    ws.append(name_row)
+    ws.append(header_row)
+
+    # Data rows
+    width = len(users) * BLOCK_WIDTH
+
+    for day, day_rows in groupby(rows, key=itemgetter(0)):
+        line = [None] * width
+
+        for _, user_id, _, in_time, out_time, total_minutes, ot_minutes in day_rows:
+            start_col = columns.get(user_id)
+            if start_col is None:
+                continue
+
+            line[start_col:start_col + len(HEADERS)] = [
+                day.strftime("%d-%m-%Y"),
+                utc_to_local_time(in_time),
+                utc_to_local_time(out_time),
+                minutes_to_hm(total_minutes),
+                minutes_to_hm(ot_minutes),
+            ]
+
+        ws.append(line)
 
-        # Column headers
-        headers = ["Date", "In", "Out", "TH", "OT"]
-        for i, h in enumerate(headers):
-            c = ws.cell(row=2, column=start_col + i, value=h)
-            c.font = header_font
-            c.alignment = center
-
-        # Data rows
-        row = 3
-        for r in user["records"]:
-            ws.cell(row=row, column=start_col, value=r["date"].strftime("%d-%m-%Y"))
-            ws.cell(row=row, column=start_col + 1, value=utc_to_local_time(r["in_time"]))
-            ws.cell(row=row, column=start_col + 2, value=utc_to_local_time(r["out_time"]))
-            ws.cell(row=row, column=start_col + 3, value=minutes_to_hm(r["total_minutes"]))
-            ws.cell(row=row, column=start_col + 4, value=minutes_to_hm(r["ot_minutes"]))
-            row += 1
-
-        start_col += 6  # 5 cols + 1 gap
-
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer
\ No newline at end of file
+    wb.save(fileobj)
@@ -0,0 +1,86 @@
+import csv
+from io import StringIO
+from itertools import islice
+from typing import BinaryIO, Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi.responses import StreamingResponse
+
+from app.core.enums import ExportFormat
+
+COLUMNS = [
+    "attendance_date",
+    "user_id",
+    "user_name",
+    "clock_in",
+    "clock_out",
+    "total_minutes",
+    "overtime_minutes",
+]
+
+PARQUET_SCHEMA = pa.schema([
+    ("attendance_date", pa.date32()),
+    ("user_id", pa.int64()),
+    ("user_name", pa.string()),
+    ("clock_in", pa.timestamp("us", tz="UTC")),
+    ("clock_out", pa.timestamp("us", tz="UTC")),
+    ("total_minutes", pa.int32()),
+    ("overtime_minutes", pa.int32()),
+])
+
+MEDIA_TYPES = {
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def write_attendance_csv(
+    fileobj: BinaryIO,
+    rows: Iterable,
+    batch_size: int = 1000,
+):
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        writer.writerows(batch)
+        fileobj.write(buffer.getvalue().encode())
+        buffer.seek(0)
+        buffer.truncate()
+
+    fileobj.write(buffer.getvalue().encode())
+
+
+def write_attendance_parquet(
+    fileobj: BinaryIO,
+    rows: Iterable,
+    batch_size: int = 10000,
+):
+    # One row group per batch, the footer is written on close
+    with pq.ParquetWriter(fileobj, PARQUET_SCHEMA, compression="zstd") as writer:
+        rows = iter(rows)
+        while batch := list(islice(rows, batch_size)):
+            columns = zip(*batch)
+            writer.write_table(
+                pa.table(
+                    [
+                        pa.array(values, type=field.type)
+                        for values, field in zip(columns, PARQUET_SCHEMA)
+                    ],
+                    schema=PARQUET_SCHEMA,
+                )
+            )
+
+
+def export_response(content, fmt: ExportFormat, start_date, end_date):
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f"attachment; filename=attendance_{start_date}_{end_date}.{fmt.value}"
+        },
+    )
@@ -0,0 +1,86 @@
+import asyncio
+import io
+from typing import AsyncIterator, BinaryIO, Callable, Iterator
+
+QUEUE_SIZE = 16
+
+_DONE = object()
+
+
+class _AsyncPipe(io.RawIOBase):
+    """Write-only, non-seekable file object that hands bytes to an asyncio queue."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__()
+        self.loop = loop
+        self.queue = queue
+        self.aborted = False
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def write(self, data) -> int:
+        # Once the reader is gone, output is discarded and the writer
+        # runs out of rows and finishes on its own.
+        if data and not self.aborted:
+            asyncio.run_coroutine_threadsafe(
+                self.queue.put(bytes(data)), self.loop
+            ).result()
+
+        self.position += len(data)
+        return len(data)
+
+
+async def _next_chunk(chunks: AsyncIterator):
+    return await chunks.__anext__()
+
+
+def _iter_rows(pipe: _AsyncPipe, chunks: AsyncIterator[list]) -> Iterator:
+    # Runs in the worker thread, pulling chunks from the event loop
+    while not pipe.aborted:
+        try:
+            chunk = asyncio.run_coroutine_threadsafe(
+                _next_chunk(chunks), pipe.loop
+            ).result()
+        except StopAsyncIteration:
+            return
+
+        yield from chunk
+
+
+async def stream_from_thread(
+    write: Callable[[BinaryIO, Iterator], None],
+    chunks: AsyncIterator[list],
+) -> AsyncIterator[bytes]:
+    """
+    Run a blocking `write(fileobj, rows)` in a worker thread and yield the
+    bytes it writes. Rows are pulled lazily from `chunks`, so neither side
+    holds more than a chunk of rows and a few buffers in memory.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    pipe = _AsyncPipe(loop, queue)
+
+    def run():
+        try:
+            write(pipe, _iter_rows(pipe, chunks))
+        finally:
+            if not pipe.aborted:
+                asyncio.run_coroutine_threadsafe(queue.put(_DONE), loop).result()
+
+    task = loop.run_in_executor(None, run)
+
+    try:
+        while (chunk := await queue.get()) is not _DONE:
+            yield chunk
+
+        await task
+    finally:
+        # Client went away or we are done: unblock and stop the writer
+        pipe.aborted = True
+        while not queue.empty():
+            queue.get_nowait()
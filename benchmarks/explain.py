@@ -0,0 +1,166 @@
+"""
+Query plan regression check for the attendance indexes.
+
+Runs the hot repository queries once against a database prepared with
+`python -m benchmarks.seed`, EXPLAINs the exact SQL and parameters they
+sent, and fails (exit 1) when a plan stops using its index or falls
+back to a sequential scan of attendance. Everything runs in transactions
+that are rolled back.
+
+    python -m benchmarks.explain
+    python -m benchmarks.explain --verbose     # print every plan
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+from zoneinfo import ZoneInfo
+
+from benchmarks.common import require_postgres
+
+from sqlalchemy import event, select
+
+from app.core.database import DbSession, engine, close_orm
+from app.core.enums import UserRole
+from app.attendance.repository import AttendanceRepository
+from app.attendance_request.repository import AttendanceRequestRepository
+from app.users.models import User
+from app.utils.date_utils import get_month_range
+import app.main  # noqa: F401  register every model
+
+IST = ZoneInfo("Asia/Kolkata")
+
+Check = tuple[str, str, Callable[[object], Awaitable]]
+
+
+def build_checks(user_id: int) -> list[Check]:
+    today = datetime.now(IST).date()
+    yesterday = today - timedelta(days=1)
+    last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+    start, end = get_month_range(last_month.year, last_month.month)
+
+    per_user = "ux_attendance_user_id_attendance_date"
+    per_date = "ix_attendance_attendance_date_user_id"
+
+    return [
+        (
+            "today_attendance", per_user,
+            lambda s: AttendanceRepository(s).get_today_attendance(user_id, yesterday),
+        ),
+        (
+            "user_month_aggregates", per_user,
+            lambda s: AttendanceRepository(s).get_monthly_aggregates(user_id, start, end),
+        ),
+        (
+            "attendance_page", per_user,
+            lambda s: AttendanceRepository(s).get_attendance_page(user_id, limit=31),
+        ),
+        (
+            "payroll_month", per_date,
+            lambda s: AttendanceRepository(s).get_payroll_aggregates(start, end, end, set()),
+        ),
+        (
+            "pending_requests", "ix_attendance_requests_pending",
+            lambda s: AttendanceRequestRepository(s).get_pending_requests(limit=50),
+        ),
+        (
+            "auto_close_sweep", "ix_attendance_open",
+            lambda s: AttendanceRepository(s).close_open_days(today, limit=500),
+        ),
+    ]
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+async def _capture(run: Callable[[object], Awaitable]) -> list[tuple[str, tuple]]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, tuple(parameters or ())))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with DbSession() as session:
+            await run(session)
+            await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    return statements
+
+
+async def _explain(statement: str, parameters: tuple) -> dict:
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        plan = await raw.driver_connection.fetchval(
+            f"EXPLAIN (FORMAT JSON) {statement}", *parameters
+        )
+        await conn.rollback()
+
+    return json.loads(plan)[0]["Plan"]
+
+
+async def run_checks(verbose: bool) -> list[str]:
+    async with DbSession() as session:
+        user_id = await session.scalar(
+            select(User.id).where(User.role == UserRole.USER).order_by(User.id).limit(1)
+        )
+
+    if not user_id:
+        sys.exit("no benchmark data, run `python -m benchmarks.seed` first")
+
+    failures = []
+
+    for name, index, run in build_checks(user_id):
+        statements = await _capture(run)
+        if not statements:
+            failures.append(f"{name}: no statement executed")
+            continue
+
+        # The check's query is the last one it sent
+        plan = await _explain(*statements[-1])
+        nodes = list(_walk(plan))
+        indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+        seq_scans = {
+            node["Relation Name"] for node in nodes
+            if node["Node Type"] == "Seq Scan"
+        }
+
+        problems = []
+        if index not in indexes:
+            problems.append(f"expected {index}, used {sorted(indexes) or 'no index'}")
+        if "attendance" in seq_scans:
+            problems.append("sequential scan on attendance")
+
+        status = "FAIL" if problems else "ok"
+        print(f"{status:4} {name}: {', '.join(problems) or index}")
+
+        if verbose or problems:
+            print(json.dumps(plan, indent=2))
+
+        failures += [f"{name}: {problem}" for problem in problems]
+
+    return failures
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    require_postgres()
+    failures = await run_checks(args.verbose)
+    await close_orm()
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Response rendering cost for large payroll and attendance payloads.
+
+Compares FastAPI's default path (jsonable_encoder + stdlib json, what a
+route returning a dict goes through) with FastJSONResponse rendering the
+same content directly through orjson.
+
+    python -m benchmarks.json_encoding --users 2000 --days 31 --repeat 20
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+
+os.environ.setdefault("PROJECT_NAME", "benchmark")
+os.environ.setdefault("ASYNC_DATABASE_URL", "postgresql+asyncpg://localhost/benchmark")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "1440")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ENV", "benchmark")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import app.main  # noqa: F401  configure all mappers
+from app.attendance.models import Attendance
+from app.core.responses import FastJSONResponse
+
+
+def _summary_payload(users: int) -> list[dict]:
+    # Shape of /admin/attendance/summary
+    rows = []
+    for user_id in range(1, users + 1):
+        rate = Decimal(500 + user_id % 700)
+        minutes = 9000 + user_id * 7 % 3000
+        payable = (Decimal(minutes) / 510 + 2) * rate
+
+        rows.append({
+            "userId": user_id,
+            "userName": f"Employee {user_id}",
+            "perDayRate": rate,
+            "presentDays": 20,
+            "paidHolidays": 2,
+            "absentDays": 1,
+            "totalWorkingMinutes": minutes,
+            "overtimeMinutes": minutes % 400,
+            "payableAmount": payable.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+            "missingClockOutCount": user_id % 3,
+        })
+    return rows
+
+
+def _attendance_payload(users: int, days: int) -> list[Attendance]:
+    # Shape of /admin/attendance/monthly/{user_id}, repeated per user
+    start = datetime(2026, 1, 1, 3, 30, tzinfo=timezone.utc)
+    records = []
+    for user_id in range(1, users + 1):
+        for day in range(days):
+            clock_in = start + timedelta(days=day, seconds=user_id)
+            records.append(Attendance(
+                id=user_id * 100 + day,
+                user_id=user_id,
+                clock_in=clock_in,
+                clock_out=clock_in + timedelta(hours=9),
+                total_minutes=540,
+                overtime_minutes=30,
+                is_manual=False,
+                attendance_date=date(2026, 1, 1) + timedelta(days=day),
+            ))
+    return records
+
+
+def _time(render, content, repeat: int) -> dict:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(render(content))
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "bytes": size,
+    }
+
+
+def _stdlib(content) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _orjson(content) -> bytes:
+    return FastJSONResponse(content).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=31)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "summary": _summary_payload(args.users),
+        "attendance": _attendance_payload(args.users // 10 or 1, args.days),
+    }
+
+    for name, content in payloads.items():
+        for mode, render in (("stdlib", _stdlib), ("orjson", _orjson)):
+            print({"payload": name, "mode": mode, **_time(render, content, args.repeat)})
+
+
+if __name__ == "__main__":
+    main()
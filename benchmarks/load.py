@@ -0,0 +1,352 @@
+"""
+Load scenarios for the hot endpoints, run in-process against the ASGI app.
+
+Needs a database prepared with `python -m benchmarks.seed`. Requests go
+straight to the app (no sockets, no server), so latencies are the app's
+own: routing, auth, SQL and serialization. The response cache is not
+started, so every summary is computed.
+
+For each scenario prints p50/p95/p99 latency, SQL statements per request
+and the process peak RSS. --save stores the run as a JSON baseline,
+--compare fails (exit 1) when p95 or queries per request regress.
+
+    python -m benchmarks.load --save main
+    python -m benchmarks.load --compare main --tolerance 0.2
+    python -m benchmarks.load --scenarios dashboard,payroll_summary
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+
+from benchmarks.common import require_postgres, percentile, peak_rss_mb
+
+from sqlalchemy import select, func, delete
+
+from app.main import app
+from app.auth.tokens import token_manager
+from app.core.database import DbSession, close_orm
+from app.core.enums import UserRole
+from app.core.metrics import track_requests
+from app.attendance.models import Attendance
+from app.users.models import User
+
+IST = ZoneInfo("Asia/Kolkata")
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    token: str
+    query: dict = field(default_factory=dict)
+
+
+@dataclass
+class Scenario:
+    name: str
+    requests: list[Request]
+    concurrency: int
+    setup: Callable[[], Awaitable[None]] | None = None
+
+
+async def call(request: Request) -> tuple[int, int]:
+    """One ASGI request, returns (status, body bytes)."""
+    query = urlencode(request.query).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": request.method,
+        "scheme": "http",
+        "path": request.path,
+        "raw_path": request.path.encode(),
+        "query_string": query,
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"authorization", f"Bearer {request.token}".encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+
+    sent = False
+    finished = asyncio.Event()
+    status = 0
+    size = 0
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        # Streaming responses listen for a disconnect until they're done
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    finished.set()
+    return status, size
+
+
+async def run(scenario: Scenario) -> dict:
+    if scenario.setup:
+        await scenario.setup()
+
+    semaphore = asyncio.Semaphore(scenario.concurrency)
+    samples = []
+
+    async def one(request: Request):
+        async with semaphore:
+            with track_requests() as stats:
+                started = time.perf_counter()
+                status, size = await call(request)
+                elapsed = time.perf_counter() - started
+
+            samples.append((elapsed * 1000, stats.statements, status, size))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(request) for request in scenario.requests))
+    wall = time.perf_counter() - started
+
+    latencies = [sample[0] for sample in samples]
+    statements = [sample[1] for sample in samples]
+
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for sample in samples if sample[2] >= 400),
+        "concurrency": scenario.concurrency,
+        "throughput_rps": round(len(samples) / wall, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+        "queries_per_request": round(statistics.mean(statements), 2),
+        "queries_max": max(statements),
+        "bytes_per_request": int(statistics.mean(sample[3] for sample in samples)),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# -------- SCENARIOS --------
+
+async def _dataset() -> dict:
+    async with DbSession() as session:
+        admin_id = await session.scalar(
+            select(User.id).where(User.role == UserRole.ADMIN).order_by(User.id).limit(1)
+        )
+        user_ids = (await session.scalars(
+            select(User.id).where(User.role == UserRole.USER).order_by(User.id)
+        )).all()
+        attendance = await session.scalar(select(func.count()).select_from(Attendance))
+
+    if not admin_id or not user_ids:
+        sys.exit("no benchmark data, run `python -m benchmarks.seed` first")
+
+    return {"admin_id": admin_id, "user_ids": list(user_ids), "attendance": attendance}
+
+
+def _months_back(today, count: int) -> list[str]:
+    months = []
+    month = today.replace(day=1)
+    for _ in range(count):
+        months.append(f"{month:%Y-%m}")
+        month = (month - timedelta(days=1)).replace(day=1)
+    return months
+
+
+def build_scenarios(args, dataset: dict) -> dict[str, Scenario]:
+    rng = random.Random(args.seed)
+    today = datetime.now(IST).date()
+    admin = token_manager.create_access_token(dataset["admin_id"], UserRole.ADMIN.value)
+    users = {
+        user_id: token_manager.create_access_token(user_id, UserRole.USER.value)
+        for user_id in dataset["user_ids"]
+    }
+    user_ids = dataset["user_ids"]
+    months = _months_back(today, 12)
+
+    async def reset_today():
+        # Every run starts the morning with nobody clocked in
+        async with DbSession() as session:
+            await session.execute(
+                delete(Attendance).where(Attendance.attendance_date == today)
+            )
+            await session.commit()
+
+    burst = user_ids[:args.requests]
+
+    return {
+        "clock_in_burst": Scenario(
+            "clock_in_burst",
+            [Request("POST", "/attendances/clock-in", users[user_id]) for user_id in burst],
+            concurrency=args.concurrency,
+            setup=reset_today,
+        ),
+        "dashboard": Scenario(
+            "dashboard",
+            [Request("GET", "/admin/dashboard", admin) for _ in range(args.requests)],
+            concurrency=args.concurrency,
+        ),
+        "monthly_summary": Scenario(
+            "monthly_summary",
+            [
+                Request(
+                    "GET", "/attendances/summary", users[rng.choice(user_ids)],
+                    {"month": rng.choice(months)},
+                )
+                for _ in range(args.requests)
+            ],
+            concurrency=args.concurrency,
+        ),
+        "payroll_summary": Scenario(
+            "payroll_summary",
+            [
+                Request("GET", "/admin/attendance/summary", admin, {"month": months[1]})
+                for _ in range(max(1, args.requests // 10))
+            ],
+            concurrency=max(1, args.concurrency // 5),
+        ),
+        "excel_export_12m": Scenario(
+            "excel_export_12m",
+            [
+                Request(
+                    "GET", "/admin/attendance/export/excel", admin,
+                    {
+                        "start_date": (today - timedelta(days=365)).isoformat(),
+                        "end_date": today.isoformat(),
+                    },
+                )
+                for _ in range(args.exports)
+            ],
+            concurrency=1,
+        ),
+    }
+
+
+# -------- BASELINES --------
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+
+    for name, current in results.items():
+        base = baseline["scenarios"].get(name)
+        if not base:
+            continue
+
+        p95_limit = base["p95_ms"] * (1 + tolerance)
+        if current["p95_ms"] > p95_limit:
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']}ms > {base['p95_ms']}ms +{tolerance:.0%}"
+            )
+
+        # Query counts are deterministic, any increase is a regression
+        if current["queries_per_request"] > base["queries_per_request"]:
+            regressions.append(
+                f"{name}: {current['queries_per_request']} queries/request "
+                f"> {base['queries_per_request']}"
+            )
+
+    return regressions
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", help="comma separated, default all")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--exports", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", metavar="NAME", help="write baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="diff against baselines/NAME.json")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown")
+    args = parser.parse_args()
+
+    require_postgres()
+    dataset = await _dataset()
+    scenarios = build_scenarios(args, dataset)
+
+    selected = args.scenarios.split(",") if args.scenarios else list(scenarios)
+    unknown = set(selected) - set(scenarios)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    # Fill the pool, prepared statements and the user/holiday caches
+    warmup = scenarios["dashboard"].requests[:1] + scenarios["monthly_summary"].requests
+    for request in warmup[:args.warmup]:
+        await call(request)
+
+    results = {}
+    for name in selected:
+        results[name] = await run(scenarios[name])
+        print(json.dumps({"scenario": name, **results[name]}))
+
+    await close_orm()
+
+    report = {
+        "meta": {
+            "created": datetime.now(IST).isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "users": len(dataset["user_ids"]),
+            "attendance_rows": dataset["attendance"],
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": results,
+    }
+
+    if args.save:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        path = BASELINE_DIR / f"{args.save}.json"
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline written to {path}")
+
+    if args.compare:
+        baseline = json.loads((BASELINE_DIR / f"{args.compare}.json").read_text())
+        regressions = compare(results, baseline, args.tolerance)
+
+        for line in regressions:
+            print(f"REGRESSION {line}")
+
+        if regressions:
+            sys.exit(1)
+
+        print(f"no regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Event-loop latency under a burst of concurrent logins.
+
+Compares calling bcrypt directly from a coroutine (the old behaviour)
+with the dedicated PasswordHasher pool. A ticker coroutine sleeps for
+`--tick` ms in a loop and records how late it wakes up; that overshoot is
+what every other request on the worker would have waited.
+
+    python -m benchmarks.password_loop_lag --logins 32 --rounds 12
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("PROJECT_NAME", "benchmark")
+os.environ.setdefault("ASYNC_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "1440")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ENV", "benchmark")
+
+import bcrypt
+
+from app.core.password import PasswordHasher, verify_password
+
+
+async def _ticker(stop: asyncio.Event, tick: float, lags: list[float]):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(tick)
+        lags.append(time.perf_counter() - started - tick)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+    return ordered[index]
+
+
+async def _run(mode: str, logins: int, hashed: str, tick: float, workers: int):
+    hasher = PasswordHasher(workers=workers, max_pending=logins)
+
+    async def login():
+        if mode == "sync":
+            return verify_password("secret", hashed)
+        return await hasher.verify("secret", hashed)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stop, tick, lags))
+    await asyncio.sleep(tick * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+
+    lags_ms = [lag * 1000 for lag in lags] or [0.0]
+    return {
+        "mode": mode,
+        "logins": logins,
+        "elapsed_s": round(elapsed, 3),
+        "loop_lag_p50_ms": round(statistics.median(lags_ms), 2),
+        "loop_lag_p99_ms": round(_percentile(lags_ms, 99), 2),
+        "loop_lag_max_ms": round(max(lags_ms), 2),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tick", type=float, default=10, help="ticker interval in ms")
+    args = parser.parse_args()
+
+    hashed = bcrypt.hashpw(b"secret", bcrypt.gensalt(args.rounds)).decode()
+
+    for mode in ("sync", "pool"):
+        result = await _run(mode, args.logins, hashed, args.tick / 1000, args.workers)
+        print(result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
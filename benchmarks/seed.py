@@ -0,0 +1,231 @@
+"""
+Seeded benchmark dataset: N users x M days of attendance, requests and
+paid holidays, ending yesterday (IST), plus one admin.
+
+Wipes every app table in ASYNC_DATABASE_URL first, so point it at a
+throwaway database. Same --seed, same data.
+
+    ASYNC_DATABASE_URL=postgresql+asyncpg://.../attendance_bench \\
+        python -m benchmarks.seed --users 200 --days 400 --yes
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, datetime, time as dtime, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from benchmarks.common import require_postgres
+
+import bcrypt
+from sqlalchemy import insert, text
+
+from app.core.database import BaseModel, DbSession, engine, close_orm
+from app.users.models import User
+from app.attendance.models import Attendance
+from app.attendance.repository import AttendanceRepository
+from app.attendance_request.models import AttendanceRequest
+from app.holidays.models import PaidHoliday
+from app.core.enums import AttendanceRequestType, AttendanceRequestStatus, UserRole
+import app.main  # noqa: F401  register every model
+
+IST = ZoneInfo("Asia/Kolkata")
+STANDARD_WORK_MINUTES = (8 * 60) + 30
+PASSWORD = "benchmark"
+ADMIN_EMAIL = "admin@bench.local"
+CHUNK = 5000
+
+TABLES = (
+    "attendance_monthly_rollup",
+    "attendance_requests",
+    "attendance",
+    "paid_holidays",
+    "refresh_tokens",
+    "users",
+)
+
+
+def user_email(user_id: int) -> str:
+    return f"user{user_id}@bench.local"
+
+
+def _holidays(rng: random.Random, start: date, end: date) -> list[dict]:
+    # One weekday holiday per month
+    holidays = []
+    month = start.replace(day=1)
+
+    while month < end:
+        day = month + timedelta(days=rng.randrange(0, 28))
+        while day.weekday() == 6:
+            day += timedelta(days=1)
+
+        if start <= day < end:
+            holidays.append({
+                "date": day,
+                "name": f"Holiday {day:%b %Y}",
+                "year": day.year,
+                "is_active": True,
+            })
+
+        month = (month + timedelta(days=32)).replace(day=1)
+
+    return holidays
+
+
+def _punches(rng: random.Random, user_id: int, day: date) -> dict:
+    # Clock-in spread around 09:00 IST so the board has Present and Late
+    clock_in = datetime.combine(day, dtime(8, 30), tzinfo=IST) + timedelta(
+        minutes=rng.randrange(0, 60), seconds=rng.randrange(0, 60)
+    )
+    row = {
+        "user_id": user_id,
+        "attendance_date": day,
+        "clock_in": clock_in,
+        "clock_out": None,
+        "total_minutes": None,
+        "overtime_minutes": 0,
+        "is_manual": False,
+        "missing_clock_out": True,
+    }
+
+    # ~2% forget to clock out, already swept by the nightly auto-close
+    if rng.random() >= 0.02:
+        worked = rng.randrange(8 * 60, 10 * 60)
+        row["clock_out"] = clock_in + timedelta(minutes=worked)
+        row["total_minutes"] = worked
+        row["overtime_minutes"] = max(0, worked - STANDARD_WORK_MINUTES)
+        row["missing_clock_out"] = False
+
+    return row
+
+
+async def _insert(session, model, rows: list[dict]) -> None:
+    for offset in range(0, len(rows), CHUNK):
+        await session.execute(insert(model), rows[offset:offset + CHUNK])
+
+
+async def seed(users: int, days: int, seed_value: int) -> dict:
+    rng = random.Random(seed_value)
+    end = datetime.now(IST).date()          # today stays empty for clock-in
+    start = end - timedelta(days=days)
+
+    # Low cost factor: logins are not what these benchmarks measure
+    password_hash = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(4)).decode()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+        await conn.execute(text(
+            f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"
+        ))
+
+    user_rows = [{
+        "id": 1,
+        "name": "Bench Admin",
+        "email": ADMIN_EMAIL,
+        "role": UserRole.ADMIN.value,
+        "password_hash": password_hash,
+        "perday_rate": None,
+    }]
+    user_rows += [{
+        "id": user_id,
+        "name": f"Employee {user_id:05d}",
+        "email": user_email(user_id),
+        "role": UserRole.USER.value,
+        "password_hash": password_hash,
+        "perday_rate": Decimal(rng.randrange(400, 1500)),
+    } for user_id in range(2, users + 2)]
+
+    holiday_rows = _holidays(rng, start, end)
+    holiday_dates = {row["date"] for row in holiday_rows}
+
+    attendance_rows = []
+    request_rows = []
+
+    day = start
+    while day < end:
+        workday = day.weekday() != 6 and day not in holiday_dates
+
+        for user_id in range(2, users + 2):
+            # ~8% absence
+            if not workday or rng.random() < 0.08:
+                continue
+
+            row = _punches(rng, user_id, day)
+            row["id"] = len(attendance_rows) + 1
+            attendance_rows.append(row)
+
+            if row["clock_out"] is None:
+                # Forgot to clock out: recent ones are still pending
+                pending = (end - day).days <= 14
+                request_rows.append({
+                    "user_id": user_id,
+                    "attendance_id": row["id"],
+                    "request_type": AttendanceRequestType.FORGOT_CLOCK_OUT,
+                    "requested_time": row["clock_in"] + timedelta(hours=9),
+                    "reason": "Forgot to clock out",
+                    "status": (
+                        AttendanceRequestStatus.PENDING if pending
+                        else rng.choice((
+                            AttendanceRequestStatus.APPROVED,
+                            AttendanceRequestStatus.REJECTED,
+                        ))
+                    ),
+                    "reviewed_by": None if pending else 1,
+                    "reviewed_at": None if pending else row["clock_in"] + timedelta(days=1),
+                })
+
+        day += timedelta(days=1)
+
+    async with DbSession() as session:
+        await _insert(session, User, user_rows)
+        await _insert(session, PaidHoliday, holiday_rows)
+        await _insert(session, Attendance, attendance_rows)
+        await _insert(session, AttendanceRequest, request_rows)
+
+        # Explicit ids above, move the sequences past them
+        for table in ("users", "attendance"):
+            await session.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT coalesce(max(id), 1) FROM {table}))"
+            ))
+
+        await session.commit()
+        await AttendanceRepository(session).rebuild_monthly_rollups()
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    return {
+        "users": users,
+        "days": days,
+        "seed": seed_value,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "attendance": len(attendance_rows),
+        "attendance_requests": len(request_rows),
+        "paid_holidays": len(holiday_rows),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--days", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--yes", action="store_true", help="confirm wiping the database")
+    args = parser.parse_args()
+
+    require_postgres()
+    if not args.yes:
+        parser.error("this truncates every table, pass --yes to confirm")
+
+    started = time.perf_counter()
+    summary = await seed(args.users, args.days, args.seed)
+    await close_orm()
+
+    print({**summary, "elapsed_s": round(time.perf_counter() - started, 1)})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())